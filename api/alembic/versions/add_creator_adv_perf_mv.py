@@ -0,0 +1,68 @@
+"""Add creator_adv_perf_mv rollup of clicks and conversions per creator/advertiser
+
+Revision ID: creator_adv_perf_mv
+Revises: creator_vector_float4
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'creator_adv_perf_mv'
+down_revision: Union[str, Sequence[str], None] = 'creator_vector_float4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the (creator_id, advertiser_id) performance rollup used by smart matching."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW creator_adv_perf_mv AS
+        WITH clicks AS (
+            SELECT cu.creator_id, c.advertiser_id, SUM(cu.unique_clicks) AS clicks
+            FROM click_uniques cu
+            JOIN perf_uploads pu ON pu.perf_upload_id = cu.perf_upload_id
+            JOIN insertions i ON i.insertion_id = pu.insertion_id
+            JOIN campaigns c ON c.campaign_id = i.campaign_id
+            GROUP BY cu.creator_id, c.advertiser_id
+        ),
+        convs AS (
+            SELECT cv.creator_id, c.advertiser_id, SUM(cv.conversions) AS conversions
+            FROM conversions cv
+            JOIN insertions i ON i.insertion_id = cv.insertion_id
+            JOIN campaigns c ON c.campaign_id = i.campaign_id
+            GROUP BY cv.creator_id, c.advertiser_id
+        )
+        SELECT
+            COALESCE(k.creator_id, v.creator_id) AS creator_id,
+            a.advertiser_id,
+            a.category,
+            COALESCE(k.clicks, 0)::bigint AS clicks,
+            COALESCE(v.conversions, 0)::bigint AS conversions
+        FROM clicks k
+        FULL JOIN convs v
+            ON v.creator_id = k.creator_id AND v.advertiser_id = k.advertiser_id
+        JOIN advertisers a
+            ON a.advertiser_id = COALESCE(k.advertiser_id, v.advertiser_id)
+    """)
+    # Unique index doubles as the key and lets the view be refreshed CONCURRENTLY
+    op.create_index(
+        'ux_creator_adv_perf_mv_creator_advertiser',
+        'creator_adv_perf_mv',
+        ['creator_id', 'advertiser_id'],
+        unique=True
+    )
+    op.create_index(
+        'ix_creator_adv_perf_mv_category_creator',
+        'creator_adv_perf_mv',
+        ['category', 'creator_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the performance rollup."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS creator_adv_perf_mv')
@@ -0,0 +1,58 @@
+"""Add creator_id covering indexes on click_uniques and conversions
+
+Revision ID: creator_covering_idx
+Revises: creator_adv_perf_mv
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'creator_covering_idx'
+down_revision: Union[str, Sequence[str], None] = 'creator_adv_perf_mv'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cover the per-creator click and conversion sums so they can use index-only scans."""
+    # CONCURRENTLY keeps the tables writable while building, but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_click_uniques_creator_covering',
+            'click_uniques',
+            ['creator_id', 'perf_upload_id'],
+            unique=False,
+            postgresql_include=['unique_clicks'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_conversions_creator_covering',
+            'conversions',
+            ['creator_id', 'insertion_id'],
+            unique=False,
+            postgresql_include=['conversions'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the creator_id covering indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_conversions_creator_covering',
+            table_name='conversions',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'ix_click_uniques_creator_covering',
+            table_name='click_uniques',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,32 @@
+"""Add functional index on lower(creators.owner_email)
+
+Revision ID: creator_lower_email_idx
+Revises: declined_creator_unique
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'creator_lower_email_idx'
+down_revision: Union[str, Sequence[str], None] = 'declined_creator_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index lower(owner_email) for the bulk creator lookup in performance uploads."""
+    op.create_index(
+        'ix_creators_lower_owner_email',
+        'creators',
+        [sa.text('lower(owner_email)')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the lower(owner_email) index."""
+    op.drop_index('ix_creators_lower_owner_email', table_name='creators')
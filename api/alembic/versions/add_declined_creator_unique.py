@@ -0,0 +1,39 @@
+"""Add unique constraint on declined_creators (creator_id, advertiser_id)
+
+Revision ID: declined_creator_unique
+Revises: merge_all_heads_final
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'declined_creator_unique'
+down_revision: Union[str, Sequence[str], None] = 'merge_all_heads_final'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Deduplicate declined creators and enforce one row per creator/advertiser."""
+    # Keep the earliest decline for each creator/advertiser pair
+    op.execute("""
+        DELETE FROM declined_creators d
+        USING declined_creators keep
+        WHERE d.creator_id = keep.creator_id
+          AND d.advertiser_id = keep.advertiser_id
+          AND d.declined_id > keep.declined_id
+    """)
+    op.create_unique_constraint(
+        'uq_declined_creator_advertiser',
+        'declined_creators',
+        ['creator_id', 'advertiser_id']
+    )
+
+
+def downgrade() -> None:
+    """Drop the declined creators unique constraint."""
+    op.drop_constraint('uq_declined_creator_advertiser', 'declined_creators', type_='unique')
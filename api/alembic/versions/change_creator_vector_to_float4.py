@@ -0,0 +1,42 @@
+"""Store creator vectors as REAL[] instead of DOUBLE PRECISION[]
+
+Revision ID: creator_vector_float4
+Revises: creator_vector_float8
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'creator_vector_float4'
+down_revision: Union[str, Sequence[str], None] = 'creator_vector_float8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Narrow creator_vectors.vector to single-precision floats."""
+    op.alter_column(
+        'creator_vectors',
+        'vector',
+        type_=postgresql.ARRAY(postgresql.REAL()),
+        existing_type=postgresql.ARRAY(postgresql.DOUBLE_PRECISION()),
+        existing_nullable=False,
+        postgresql_using='vector::real[]'
+    )
+
+
+def downgrade() -> None:
+    """Widen creator_vectors.vector back to double-precision floats."""
+    op.alter_column(
+        'creator_vectors',
+        'vector',
+        type_=postgresql.ARRAY(postgresql.DOUBLE_PRECISION()),
+        existing_type=postgresql.ARRAY(postgresql.REAL()),
+        existing_nullable=False,
+        postgresql_using='vector::double precision[]'
+    )
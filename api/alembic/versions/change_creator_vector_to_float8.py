@@ -0,0 +1,42 @@
+"""Store creator vectors as DOUBLE PRECISION[] instead of NUMERIC[]
+
+Revision ID: creator_vector_float8
+Revises: creator_lower_email_idx
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'creator_vector_float8'
+down_revision: Union[str, Sequence[str], None] = 'creator_lower_email_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert creator_vectors.vector to a fixed-width float array."""
+    op.alter_column(
+        'creator_vectors',
+        'vector',
+        type_=postgresql.ARRAY(postgresql.DOUBLE_PRECISION()),
+        existing_type=postgresql.ARRAY(sa.Numeric()),
+        existing_nullable=False,
+        postgresql_using='vector::double precision[]'
+    )
+
+
+def downgrade() -> None:
+    """Convert creator_vectors.vector back to NUMERIC[]."""
+    op.alter_column(
+        'creator_vectors',
+        'vector',
+        type_=postgresql.ARRAY(sa.Numeric()),
+        existing_type=postgresql.ARRAY(postgresql.DOUBLE_PRECISION()),
+        existing_nullable=False,
+        postgresql_using='vector::numeric[]'
+    )
@@ -11,6 +11,11 @@ class Settings(BaseSettings):
     JWT_SECRET: str = "your-secret-key-change-in-production"  # Change this in production!
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_USE_PGBOUNCER: bool = False  # Transaction-mode PgBouncer can't keep server-side prepared statements
     
     class Config:
         env_file = ".env"
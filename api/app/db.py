@@ -3,7 +3,20 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
-engine = create_engine(settings.DATABASE_URL.replace("postgresql://", "postgresql+psycopg://"))
+# Bulk inserts (ORM flushes, insert(Model) with a list of dicts) are batched into
+# multi-row INSERT ... VALUES statements; the dialect still caps bound parameters per statement.
+# The pool is sized for concurrent uploads; pre-ping and recycle drop connections the server
+# or a proxy has closed.
+engine = create_engine(
+    settings.DATABASE_URL.replace("postgresql://", "postgresql+psycopg://"),
+    insertmanyvalues_page_size=5000,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    connect_args={"prepare_threshold": None} if settings.DB_USE_PGBOUNCER else {},
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -3,10 +3,16 @@ Demographic matching utilities for smart planner.
 Handles age range, gender, location, and interests matching.
 """
 
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple, Optional, Sequence
 import re
+import numpy as np
 
+# Weights of the age, gender, location and interests components
+_DEMOGRAPHIC_WEIGHTS = np.array([0.3, 0.2, 0.2, 0.3])
 
+
+@lru_cache(maxsize=4096)
 def match_age_ranges(creator_age: str, target_age: str) -> float:
     """
     Calculate age range similarity score.
@@ -54,6 +60,7 @@ def _parse_age_range(age_range: str) -> Tuple[Optional[int], Optional[int]]:
     return None, None
 
 
+@lru_cache(maxsize=4096)
 def match_gender_skew(creator_gender: str, target_gender: str) -> float:
     """
     Calculate gender skew similarity score.
@@ -79,6 +86,7 @@ def match_gender_skew(creator_gender: str, target_gender: str) -> float:
     return 0.0
 
 
+@lru_cache(maxsize=4096)
 def match_location(creator_location: str, target_location: str) -> float:
     """
     Calculate location similarity score.
@@ -96,6 +104,7 @@ def match_location(creator_location: str, target_location: str) -> float:
     return 0.0
 
 
+@lru_cache(maxsize=4096)
 def match_interests(creator_interests: str, target_interests: str) -> float:
     """
     Calculate interests similarity score.
@@ -209,3 +218,47 @@ def calculate_demographic_similarity(
     
     weighted_sum = sum(score * weight for score, weight in zip(scores, weights))
     return weighted_sum / total_weight
+
+
+def calculate_demographic_similarities(
+    age_ranges: Sequence[Optional[str]],
+    gender_skews: Sequence[Optional[str]],
+    locations: Sequence[Optional[str]],
+    interests: Sequence[Optional[str]],
+    target_demographics: dict
+) -> np.ndarray:
+    """
+    Vectorized calculate_demographic_similarity over N creators.
+    
+    Takes the creators' demographic fields as parallel sequences and returns an
+    array of N scores, equal to calling calculate_demographic_similarity per creator.
+    """
+    n = len(age_ranges)
+    targets = (
+        target_demographics.get('target_age_range'),
+        target_demographics.get('target_gender_skew'),
+        target_demographics.get('target_location'),
+        target_demographics.get('target_interests')
+    )
+    scores = np.zeros((n, 4))
+    present = np.zeros((n, 4), dtype=bool)
+    
+    # The matchers are memoized on (creator value, target value), so repeated
+    # demographic values across creators and requests are scored once
+    for col, (values, target, matcher) in enumerate((
+        (age_ranges, targets[0], match_age_ranges),
+        (gender_skews, targets[1], match_gender_skew),
+        (locations, targets[2], match_location),
+        (interests, targets[3], match_interests)
+    )):
+        if not target:
+            continue
+        for i, value in enumerate(values):
+            if value:
+                scores[i, col] = matcher(value, target)
+                present[i, col] = True
+    
+    # Weighted average over the components present for each creator
+    total_weight = present @ _DEMOGRAPHIC_WEIGHTS
+    weighted_sum = (scores * present) @ _DEMOGRAPHIC_WEIGHTS
+    return np.divide(weighted_sum, total_weight, out=np.zeros(n), where=total_weight > 0)
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, Boolean, Text, ForeignKey, TIMESTAMP, ARRAY
-from sqlalchemy.dialects.postgresql import CITEXT, DATERANGE, JSONB
+from sqlalchemy.dialects.postgresql import CITEXT, DATERANGE, JSONB, REAL
 from sqlalchemy.orm import relationship
-from sqlalchemy.schema import CheckConstraint
+from sqlalchemy.schema import CheckConstraint, UniqueConstraint
 from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from app.db import Base
 
@@ -41,7 +41,7 @@ class Insertion(Base):
     campaign_id = Column(Integer, ForeignKey("campaigns.campaign_id"), nullable=False)
     month_start = Column(Date, nullable=False)
     month_end = Column(Date, nullable=False)
-    cpc = Column(Numeric(10, 4), nullable=False)
+    cpc = Column(Numeric(10, 4, asdecimal=False), nullable=False)  # Stored exactly, read as float
     
     # Relationships
     campaign = relationship("Campaign", back_populates="insertions")
@@ -182,6 +182,7 @@ class DeclinedCreator(Base):
     # Unique constraint to prevent duplicate declined records
     __table_args__ = (
         CheckConstraint("creator_id != advertiser_id", name="check_creator_not_advertiser"),
+        UniqueConstraint("creator_id", "advertiser_id", name="uq_declined_creator_advertiser"),
     )
 
 
@@ -263,7 +264,7 @@ class CreatorVector(Base):
     __tablename__ = "creator_vectors"
     
     creator_id = Column(Integer, ForeignKey("creators.creator_id"), nullable=False, primary_key=True)
-    vector = Column(ARRAY(Numeric), nullable=False)  # Vector embedding as array of floats
+    vector = Column(ARRAY(REAL), nullable=False)  # Vector embedding as array of float4
     vector_dimension = Column(Integer, nullable=False)  # Dimension of the vector
     created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default="now()")
     updated_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default="now()")
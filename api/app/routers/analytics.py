@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text, case, and_, or_, desc
-from typing import Dict, Any, List, Optional
+from sqlalchemy import func, text, case, and_, or_, desc, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from typing import Dict, Any, List, Optional, Union
 import logging
 import numpy as np
+import orjson
 import csv
 import io
 import smtplib
@@ -11,10 +13,10 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import date, timedelta
 from app.models import Creator, ClickUnique, PerfUpload, Insertion, Campaign, Advertiser, Conversion, ConvUpload, DeclinedCreator, Placement
-from app.smart_matching import SmartMatchingService
+from app.smart_matching import SmartMatchingService, parse_acct_ids
 from app.db import get_db
 
 router = APIRouter()
@@ -216,7 +218,7 @@ def _batch_calculate_performance_data(creators, advertiser_id, category, db):
     ).join(
         Campaign, Campaign.campaign_id == Insertion.campaign_id
     ).filter(
-        Creator.creator_id.in_(creator_ids)
+        Creator.creator_id == any_(bindparam('creator_ids', creator_ids, type_=ARRAY(Integer)))
     )
     
     # Add category/advertiser filters
@@ -238,7 +240,7 @@ def _batch_calculate_performance_data(creators, advertiser_id, category, db):
     ).join(
         ConvUpload, ConvUpload.conv_upload_id == Conversion.conv_upload_id
     ).filter(
-        Creator.creator_id.in_(creator_ids)
+        Creator.creator_id == any_(bindparam('creator_ids', creator_ids, type_=ARRAY(Integer)))
     )
     
     # Add category/advertiser filters for conversions
@@ -327,6 +329,8 @@ class PlanRequest(BaseModel):
     # Email export field
     email: Optional[str] = None  # Email address to send plan CSV
 
+    model_config = ConfigDict(hide_input_in_errors=True)
+
 
 class CreatorStats(BaseModel):
     creator_id: int
@@ -361,6 +365,14 @@ class PlanResponse(BaseModel):
     budget_utilization: float
 
 
+def plan_json_response(plan_response: PlanResponse) -> Response:
+    """
+    Serialize a plan straight to JSON. The plan routes keep response_model=PlanResponse for the
+    API schema, but returning a Response stops FastAPI re-validating every picked creator.
+    """
+    return Response(content=plan_response.model_dump_json(), media_type="application/json")
+
+
 @router.get("/declined-creators/{advertiser_id}")
 async def get_declined_creators(
     advertiser_id: int,
@@ -396,11 +408,27 @@ async def get_declined_creators(
     ]
 
 
-@router.get("/filter-options")
-async def get_filter_options(db: Session = Depends(get_db)) -> Dict[str, List[str]]:
+# Encoded /filter-options payload, rebuilt on the next request after invalidate_filter_options()
+_filter_options_json: Optional[bytes] = None
+
+
+def invalidate_filter_options() -> None:
+    """
+    Drop the cached filter options; called by the routes that add advertisers or change creators.
+    """
+    global _filter_options_json
+    _filter_options_json = None
+
+
+@router.get("/filter-options", response_model=Dict[str, List[str]])
+async def get_filter_options(db: Session = Depends(get_db)) -> Response:
     """
     Get available filter options for leaderboard dropdowns.
     """
+    global _filter_options_json
+    if _filter_options_json is not None:
+        return Response(content=_filter_options_json, media_type="application/json")
+    
     # Get advertiser categories
     advertiser_categories = db.query(Advertiser.category).filter(
         Advertiser.category.isnot(None)
@@ -414,10 +442,11 @@ async def get_filter_options(db: Session = Depends(get_db)) -> Dict[str, List[st
     topics_list = [topic[0] for topic in creator_topics if topic[0]]
     print(f"DEBUG: Available creator topics: {topics_list}")
     
-    return {
+    _filter_options_json = orjson.dumps({
         "advertiser_categories": [cat[0] for cat in advertiser_categories if cat[0]],
         "creator_topics": topics_list
-    }
+    })
+    return Response(content=_filter_options_json, media_type="application/json")
 
 
 @router.get("/leaderboard")
@@ -551,18 +580,21 @@ async def get_leaderboard(
         print(f"  - Average CVR: {row.avg_cvr:.4f}")
         if hasattr(row, 'expected_cpa') and row.expected_cpa:
             print(f"  - Expected CPA: {row.expected_cpa:.2f}")
-        creator_stats = CreatorStats(
+        expected_cpa = None
+        if cpc and cpc > 0 and hasattr(row, 'expected_cpa'):
+            expected_cpa = float(row.expected_cpa) if row.expected_cpa else None
+        
+        # Every field is already converted to its declared type above, so skip validation
+        creator_stats = CreatorStats.model_construct(
             creator_id=row.creator_id,
             name=row.name,
             acct_id=row.acct_id,
             clicks=int(row.avg_clicks),
             conversions=int(row.avg_conversions),
-            cvr=float(row.avg_cvr)
+            cvr=float(row.avg_cvr),
+            expected_cpa=expected_cpa
         )
         
-        if cpc and cpc > 0 and hasattr(row, 'expected_cpa'):
-            creator_stats.expected_cpa = float(row.expected_cpa) if row.expected_cpa else None
-        
         leaderboard.append(creator_stats)
     
     return leaderboard
@@ -572,7 +604,7 @@ async def get_leaderboard(
 async def create_plan(
     plan_request: PlanRequest,
     db: Session = Depends(get_db)
-) -> PlanResponse:
+) -> Union[PlanResponse, Response]:
     """
     Create a budget allocation plan for creators based on historical performance.
     """
@@ -653,27 +685,24 @@ async def create_plan(
     print(f"DEBUG: Found {len(creators)} creators for planning")
     logging.info(f"Found {len(creators)} creators for planning")
     
+    # Parse include (additive) and exclude (restrictive) Acct IDs; lists of only blanks parse to empty sets
+    include_acct_ids = parse_acct_ids(plan_request.include_acct_ids)
+    exclude_acct_ids = parse_acct_ids(plan_request.exclude_acct_ids)
+    
     # Apply creator filtering based on Acct IDs
-    if plan_request.include_acct_ids or plan_request.exclude_acct_ids:
+    if include_acct_ids or exclude_acct_ids:
         print("DEBUG: Applying creator filtering")
-        
-        # Parse include Acct IDs (additive - ensure these creators are included)
-        include_acct_ids = set()
-        if plan_request.include_acct_ids:
-            include_acct_ids = {acct_id.strip() for acct_id in plan_request.include_acct_ids.split(',') if acct_id.strip()}
+        if include_acct_ids:
             print(f"DEBUG: Include Acct IDs (additive): {include_acct_ids}")
-        
-        # Parse exclude Acct IDs (restrictive - exclude these creators)
-        exclude_acct_ids = set()
-        if plan_request.exclude_acct_ids:
-            exclude_acct_ids = {acct_id.strip() for acct_id in plan_request.exclude_acct_ids.split(',') if acct_id.strip()}
+        if exclude_acct_ids:
             print(f"DEBUG: Exclude Acct IDs: {exclude_acct_ids}")
         
+        # Strip each creator's Acct ID once; both passes below reuse it
+        creators_with_acct_ids = [(creator, creator.acct_id.strip()) for creator in creators]
+        
         # First, filter out excluded creators
         filtered_creators = []
-        for creator in creators:
-            creator_acct_id = creator.acct_id.strip()
-            
+        for creator, creator_acct_id in creators_with_acct_ids:
             # If exclude list is specified, exclude creators in that list
             if exclude_acct_ids and creator_acct_id in exclude_acct_ids:
                 print(f"DEBUG: Excluding creator {creator.name} (Acct ID: {creator_acct_id}) - in exclude list")
@@ -685,13 +714,12 @@ async def create_plan(
         # If include list is specified, ensure those creators are added even if not in filtered list
         if include_acct_ids:
             print("DEBUG: Adding required creators from include list")
-            for creator in creators:
-                creator_acct_id = creator.acct_id.strip()
-                if creator_acct_id in include_acct_ids:
-                    # Check if already in filtered list
-                    if not any(c.creator_id == creator.creator_id for c in filtered_creators):
-                        filtered_creators.append(creator)
-                        print(f"DEBUG: Added required creator {creator.name} (Acct ID: {creator_acct_id})")
+            filtered_ids = {c.creator_id for c in filtered_creators}
+            for creator, creator_acct_id in creators_with_acct_ids:
+                if creator_acct_id in include_acct_ids and creator.creator_id not in filtered_ids:
+                    filtered_creators.append(creator)
+                    filtered_ids.add(creator.creator_id)
+                    print(f"DEBUG: Added required creator {creator.name} (Acct ID: {creator_acct_id})")
         
         creators = filtered_creators
         print(f"DEBUG: After filtering: {len(creators)} creators remaining")
@@ -980,20 +1008,20 @@ async def create_plan(
     
     print(f"DEBUG: Final results - {len(picked_creators)} creators, ${total_spend:.2f} spend, {total_conversions:.2f} conversions, ${blended_cpa:.2f} CPA, {budget_utilization:.2%} utilization")
     
-    return PlanResponse(
+    return plan_json_response(PlanResponse(
         picked_creators=picked_creators,
         total_spend=total_spend,
         total_conversions=total_conversions,
         blended_cpa=blended_cpa,
         budget_utilization=budget_utilization
-    )
+    ))
 
 
 @router.post("/plan-smart", response_model=PlanResponse)
 async def create_smart_plan(
     plan_request: PlanRequest,
     db: Session = Depends(get_db)
-) -> PlanResponse:
+) -> Union[PlanResponse, Response]:
     """
     Create a smart budget allocation plan using multi-tier creator selection.
     """
@@ -1304,21 +1332,14 @@ async def create_smart_plan(
                             pc = picked_creators[existing_creator]
                             new_placements = pc.recommended_placements + 1
                             
-                            # Update the existing creator with multiplied values
-                            picked_creators[existing_creator] = PlanCreator(
-                                creator_id=pc.creator_id,
-                                name=pc.name,
-                                acct_id=pc.acct_id,
-                                expected_cvr=pc.expected_cvr,
-                                expected_cpa=pc.expected_cpa,
-                                clicks_per_day=pc.clicks_per_day,
-                                expected_clicks=expected_clicks * new_placements,
-                                expected_spend=expected_spend * new_placements,
-                                expected_conversions=expected_conversions * new_placements,
-                                value_ratio=pc.value_ratio,
-                                recommended_placements=new_placements,
-                                median_clicks_per_placement=pc.median_clicks_per_placement
-                            )
+                            # Update the existing creator with multiplied values; copying the already-validated
+                            # instance skips re-running every field validator for values computed here
+                            picked_creators[existing_creator] = pc.model_copy(update={
+                                'expected_clicks': float(expected_clicks * new_placements),
+                                'expected_spend': float(expected_spend * new_placements),
+                                'expected_conversions': float(expected_conversions * new_placements),
+                                'recommended_placements': new_placements
+                            })
                             
                             total_spend += expected_spend
                             total_conversions += expected_conversions
@@ -1506,21 +1527,14 @@ async def create_smart_plan(
                                     pc = picked_creators[existing_creator]
                                     new_placements = pc.recommended_placements + 1
                                     
-                                    # Update the existing creator with multiplied values
-                                    picked_creators[existing_creator] = PlanCreator(
-                                        creator_id=pc.creator_id,
-                                        name=pc.name,
-                                        acct_id=pc.acct_id,
-                                        expected_cvr=pc.expected_cvr,
-                                        expected_cpa=pc.expected_cpa,
-                                        clicks_per_day=pc.clicks_per_day,
-                                        expected_clicks=expected_clicks * new_placements,
-                                        expected_spend=expected_spend * new_placements,
-                                        expected_conversions=expected_conversions * new_placements,
-                                        value_ratio=pc.value_ratio,
-                                        recommended_placements=new_placements,
-                                        median_clicks_per_placement=pc.median_clicks_per_placement
-                                    )
+                                    # Update the existing creator with multiplied values; copying the already-validated
+                                    # instance skips re-running every field validator for values computed here
+                                    picked_creators[existing_creator] = pc.model_copy(update={
+                                        'expected_clicks': float(expected_clicks * new_placements),
+                                        'expected_spend': float(expected_spend * new_placements),
+                                        'expected_conversions': float(expected_conversions * new_placements),
+                                        'recommended_placements': new_placements
+                                    })
                                     
                                     total_spend += expected_spend
                                     total_conversions += expected_conversions
@@ -1573,7 +1587,7 @@ async def create_smart_plan(
             else:
                 print(f"DEBUG: Failed to send plan email to {plan_request.email}")
         
-        return plan_response
+        return plan_json_response(plan_response)
         
     except Exception as e:
         print(f"DEBUG: Smart matching error: {e}")
@@ -1605,62 +1619,6 @@ async def download_plan_csv(
         print(f"DEBUG: CSV download error: {e}")
         raise HTTPException(status_code=500, detail=f"CSV download failed: {str(e)}")
     
-def _get_other_campaigns_clicks(creator: Creator, advertiser_id: Optional[int], category: Optional[str], db: Session) -> int:
-    """Get click estimates from other campaigns for this creator."""
-    from sqlalchemy import func, and_
-    from app.models import ClickUnique, PerfUpload, Insertion, Campaign, Advertiser
-    
-    print(f"DEBUG: Getting other campaigns clicks for creator {creator.creator_id}")
-    
-    # Build query for clicks from OTHER campaigns
-    other_campaigns_query = db.query(func.sum(ClickUnique.unique_clicks)).join(
-        PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-    ).join(
-        Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-    ).join(
-        Campaign, Campaign.campaign_id == Insertion.campaign_id
-    ).filter(ClickUnique.creator_id == creator.creator_id)
-    
-    # Exclude the current advertiser/category
-    if advertiser_id:
-        other_campaigns_query = other_campaigns_query.filter(Campaign.advertiser_id != advertiser_id)
-    elif category:
-        other_campaigns_query = other_campaigns_query.join(
-            Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-        ).filter(Advertiser.category != category)
-    
-    total_other_clicks = other_campaigns_query.scalar() or 0
-    print(f"DEBUG: Creator {creator.creator_id} - Total other campaigns clicks: {total_other_clicks}")
-    
-    if total_other_clicks > 0:
-        # Get individual placement clicks from other campaigns to calculate median
-        placement_clicks_query = db.query(ClickUnique.unique_clicks).join(
-            PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-        ).join(
-            Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).filter(ClickUnique.creator_id == creator.creator_id)
-        
-        # Exclude current advertiser/category
-        if advertiser_id:
-            placement_clicks_query = placement_clicks_query.filter(Campaign.advertiser_id != advertiser_id)
-        elif category:
-            placement_clicks_query = placement_clicks_query.join(
-                Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-            ).filter(Advertiser.category != category)
-        
-        placement_clicks = [row[0] for row in placement_clicks_query.all() if row[0] is not None]
-        
-        if placement_clicks:
-            # Calculate median clicks per placement from other campaigns
-            placement_clicks.sort()
-            median_clicks = placement_clicks[len(placement_clicks) // 2]
-            print(f"DEBUG: Creator {creator.creator_id} - Median clicks from other campaigns: {median_clicks}")
-            return median_clicks
-    
-    return 0
-
 
 @router.get("/historical-data")
 async def get_historical_data(
@@ -120,12 +120,7 @@ async def signup(
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserOut(
-            user_id=db_user.user_id,
-            email=db_user.email,
-            name=db_user.name,
-            created_at=db_user.created_at.isoformat()
-        )
+        user=UserOut.model_validate(db_user)
     )
 
 
@@ -158,12 +153,7 @@ async def signin(
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserOut(
-            user_id=user.user_id,
-            email=user.email,
-            name=user.name,
-            created_at=user.created_at.isoformat()
-        )
+        user=UserOut.model_validate(user)
     )
 
 
@@ -172,10 +162,5 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get current authenticated user information."""
-    return UserOut(
-        user_id=current_user.user_id,
-        email=current_user.email,
-        name=current_user.name,
-        created_at=current_user.created_at.isoformat()
-    )
+    return UserOut.model_validate(current_user)
 
@@ -9,6 +9,7 @@ from app.schemas import (
     CreatorOut
 )
 from app.db import get_db
+from app.routers.analytics import invalidate_filter_options
 
 router = APIRouter()
 
@@ -19,6 +20,7 @@ def create_advertiser(advertiser: AdvertiserIn, db: Session = Depends(get_db)):
     db_advertiser = Advertiser(**advertiser.dict())
     db.add(db_advertiser)
     db.commit()
+    invalidate_filter_options()
     db.refresh(db_advertiser)
     return db_advertiser
 
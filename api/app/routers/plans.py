@@ -5,7 +5,7 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 import json
 from app.models import Plan, User
-from app.schemas import PlanRequest, PlanResponse
+from app.schemas import PlanRequest, PlanResponse, PLAN_CREATOR_LIST_ADAPTER
 from app.db import get_db
 from app.routers.auth import get_current_user
 from app.routers.analytics import generate_plan_csv
@@ -91,14 +91,9 @@ async def confirm_plan(
         
         # Generate plan data for email
         # Convert dict to PlanResponse and PlanRequest objects
-        from app.schemas import PlanCreator
-        
-        # Convert plan_data dict to PlanResponse
+        # Convert plan_data dict to PlanResponse; the stored creator list is validated in one call
         plan_data_dict = plan.plan_data
-        picked_creators = [
-            PlanCreator(**creator_data) 
-            for creator_data in plan_data_dict.get('picked_creators', [])
-        ]
+        picked_creators = PLAN_CREATOR_LIST_ADAPTER.validate_python(plan_data_dict.get('picked_creators', []))
         plan_response = PlanResponse(
             picked_creators=picked_creators,
             total_spend=plan_data_dict.get('total_spend', 0),
@@ -2,11 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Backgro
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 import csv
-import io
 import asyncio
 from typing import Dict, Any, List
 from app.models import Creator, CreatorTopic, CreatorKeyword, ClickUnique, Conversion, Placement, DeclinedCreator
 from app.db import get_db
+from app.routers.analytics import invalidate_filter_options
+from app.routers.uploads import iter_csv_lines
+from app.smart_matching import refresh_creator_performance_rollup
 from datetime import datetime
 
 router = APIRouter()
@@ -53,8 +55,11 @@ def wipe_all_creators(db: Session) -> int:
         creators_deleted = db.query(Creator).delete()
         print(f"DEBUG: Deleted {creators_deleted} creator records")
         
+        refresh_creator_performance_rollup(db)
+        
         # Commit the wipe
         db.commit()
+        invalidate_filter_options()
         print(f"DEBUG: Successfully wiped all creator data")
         return creators_deleted
         
@@ -98,7 +103,10 @@ def safe_delete_creator(db: Session, creator_id: int) -> bool:
         print(f"DEBUG: Deleted {creator_deleted} creator record")
         
         if creator_deleted > 0:
+            if clicks_deleted or conversions_deleted:
+                refresh_creator_performance_rollup(db)
             db.commit()
+            invalidate_filter_options()
             print(f"DEBUG: Successfully deleted creator {creator_id}")
             return True
         else:
@@ -167,6 +175,7 @@ def process_batch(db: Session, batch: List[Dict[str, Any]]) -> int:
     
     # Commit the batch
     db.commit()
+    invalidate_filter_options()
     return upserted
 
 
@@ -309,6 +318,7 @@ def process_batch_optimized(db: Session, batch: List[Dict[str, Any]]) -> Dict[st
         
         # Commit the batch
         db.commit()
+        invalidate_filter_options()
         
         # Log summary
         if skipped_details:
@@ -366,10 +376,8 @@ async def seed_creators(
             wiped = wipe_all_creators(db)
             print(f"DEBUG: Wiped {wiped} creators, now loading from CSV...")
         
-        # Read CSV content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Stream CSV rows straight from the upload instead of decoding the whole file into memory
+        csv_reader = csv.DictReader(iter_csv_lines(file))
         
         upserted = 0
         skipped = 0
@@ -479,8 +487,8 @@ async def seed_creators(
             print(f"DEBUG: Full sync mode - identifying creators to delete...")
             
             # Get all creator IDs from CSV (we need to re-read the CSV for this)
-            csv_content_rewind = content.decode('utf-8')
-            csv_reader_rewind = csv.DictReader(io.StringIO(csv_content_rewind))
+            file.file.seek(0)
+            csv_reader_rewind = csv.DictReader(iter_csv_lines(file))
             
             csv_acct_ids = set()
             csv_emails = set()
@@ -604,17 +612,16 @@ async def seed_creators_async(
     # For now, just process normally but with better error handling
     # In the future, this could be enhanced with Redis/background job processing
     try:
-        # Read CSV content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Stream CSV rows straight from the upload instead of decoding the whole file into memory
+        csv_reader = csv.DictReader(iter_csv_lines(file))
         
         # Count total rows first
         total_rows = sum(1 for _ in csv_reader)
         print(f"DEBUG: Starting async sync for {total_rows} creators")
         
         # Reset reader
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        file.file.seek(0)
+        csv_reader = csv.DictReader(iter_csv_lines(file))
         
         upserted = 0
         skipped = 0
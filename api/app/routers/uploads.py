@@ -1,18 +1,177 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
-from sqlalchemy.dialects.postgresql import DATERANGE
+from sqlalchemy import func, text, delete, select, literal_column, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, DATERANGE, insert as pg_insert
 import csv
+import functools
 import io
+import logging
 import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime, date
-import pytz
+from typing import Dict, Any, Iterator, List, Optional
+from datetime import datetime, date, timezone
+import numpy as np
 from app.models import Creator, PerfUpload, ClickUnique, Insertion, ConvUpload, Conversion, Advertiser, Campaign, DeclinedCreator, CreatorVector
 from app.db import get_db
+from app.smart_matching import refresh_creator_performance_rollup
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Compiled once at import; extract_email_from_creator runs for every CSV row
+_MAILTO_RE = re.compile(r'\[mailto:([^\]]+)\]', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Character classes of _EMAIL_RE, used to recognise bare emails without running the regex
+_EMAIL_LOCAL_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.-')
+
+# Candidate formats keyed by (separator, year comes first); only these shapes can match.
+# Tried in order, so month-first wins over day-first for ambiguous dates.
+_EXECUTION_DATE_FORMATS_BY_SHAPE = {
+    ('-', True): ('%Y-%m-%d',),
+    ('-', False): ('%m-%d-%Y', '%d-%m-%Y'),
+    ('/', True): ('%Y/%m/%d',),
+    ('/', False): ('%m/%d/%Y', '%d/%m/%Y'),
+}
+
+# Accepted spellings of the flagged column, matched after lowercasing
+_FLAGGED_TRUE_VALUES = frozenset({'true', '1', 'yes', 'y', 't'})
+_FLAGGED_FALSE_VALUES = frozenset({'false', '0', 'no', 'n', 'f'})
+
+# Column order of the tuples passed to write_click_uniques
+CLICK_UNIQUE_COLUMNS = (
+    'perf_upload_id', 'creator_id', 'execution_date', 'unique_clicks', 'raw_clicks', 'flagged', 'status'
+)
+
+# Maximum number of keys per IN lookup when resolving uploaded rows to creators
+CSV_LOOKUP_BATCH_SIZE = 5000
+
+# Upper bound on upload request bodies (checked from Content-Length in main.py) and on decoded CSV text
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
+# Content types browsers and tools send for .csv files
+CSV_CONTENT_TYPES = frozenset({'text/csv', 'application/csv', 'text/plain', 'application/vnd.ms-excel'})
+
+
+def validate_csv_upload(file: UploadFile) -> None:
+    """
+    Reject uploads that are not CSV before any of the file is read.
+    Generic or missing content types fall back to the .csv extension.
+    """
+    content_type = (file.content_type or '').split(';')[0].strip().lower()
+    if content_type in CSV_CONTENT_TYPES:
+        return
+    if content_type in ('', 'application/octet-stream') and (file.filename or '').lower().endswith('.csv'):
+        return
+    raise HTTPException(status_code=400, detail="File must be a CSV")
+
+
+def iter_csv_lines(file: UploadFile, max_chars: int = MAX_UPLOAD_BYTES) -> Iterator[str]:
+    """
+    Stream decoded lines from an uploaded CSV without reading the whole file into memory.
+    Raises a 413 once more than max_chars characters have been read.
+    """
+    text_stream = io.TextIOWrapper(file.file, encoding='utf-8', newline='')
+    total_chars = 0
+    try:
+        for line in text_stream:
+            total_chars += len(line)
+            if total_chars > max_chars:
+                raise HTTPException(status_code=413, detail="CSV file is too large")
+            yield line
+    finally:
+        # Leave the underlying upload file open for FastAPI to clean up
+        text_stream.detach()
+
+
+def write_click_uniques(db: Session, click_rows: List[tuple]) -> None:
+    """
+    Bulk-write click_uniques rows given as tuples in CLICK_UNIQUE_COLUMNS order with a single COPY stream.
+    """
+    # Raw psycopg connection bound to the session's current transaction
+    raw_connection = db.connection().connection
+    with raw_connection.cursor() as cursor:
+        with cursor.copy(
+            f"COPY click_uniques ({', '.join(CLICK_UNIQUE_COLUMNS)}) FROM STDIN"
+        ) as copy:
+            for click_row in click_rows:
+                copy.write_row(click_row)
+
+
+def _match_plain_email(value: str) -> Optional[str]:
+    """
+    Return value lowercased if the whole string is an email _EMAIL_RE would match, else None.
+    """
+    local, at, domain = value.partition('@')
+    if not at or not local or not (local[0].isalnum() or local[0] == '_'):
+        return None
+    if not _EMAIL_LOCAL_CHARS.issuperset(local) or not _EMAIL_DOMAIN_CHARS.issuperset(domain):
+        return None
+    name, dot, tld = domain.rpartition('.')
+    if not dot or not name or len(tld) < 2 or not tld.isalpha():
+        return None
+    return value.lower()
+
+
+def _cell(row: List[str], index: Optional[int]) -> str:
+    """
+    Stripped value of a csv.reader row at a pre-resolved column index; '' if the column is absent.
+    """
+    if index is None or index >= len(row):
+        return ''
+    return row[index].strip()
+
+
+def _parse_click_fields(
+    row: List[str],
+    clicks_col: Optional[int],
+    unique_col: Optional[int],
+    flagged_col: Optional[int],
+    execution_date_col: Optional[int],
+    status_col: Optional[int]
+) -> Optional[tuple]:
+    """
+    Parse the performance fields of a CSV row into (execution_date, unique_clicks, raw_clicks, flagged, status).
+    Returns None for rows that should not be stored.
+    """
+    clicks_str = _cell(row, clicks_col)
+    unique_str = _cell(row, unique_col)
+    flagged_str = _cell(row, flagged_col)
+    execution_date_str = _cell(row, execution_date_col)
+    status = _cell(row, status_col)
+    
+    # Skip rows with "unscheduled" status - these should not be stored or used in forecasts
+    if status and status.lower() == "unscheduled":
+        return None
+    
+    # Skip rows with missing required performance fields
+    if not unique_str or not execution_date_str:
+        return None
+    
+    # Parse numeric values
+    try:
+        unique_clicks = int(unique_str) if unique_str else 0
+        raw_clicks = int(clicks_str) if clicks_str else None
+    except ValueError:
+        return None
+    
+    # Parse flagged as boolean
+    flagged = None
+    flagged_lower = flagged_str.lower()
+    if flagged_lower in _FLAGGED_TRUE_VALUES:
+        flagged = True
+    elif flagged_lower in _FLAGGED_FALSE_VALUES:
+        flagged = False
+    
+    # Normalize execution date
+    execution_date = normalize_execution_date(execution_date_str)
+    if not execution_date:
+        return None
+    
+    return execution_date, unique_clicks, raw_clicks, flagged, status if status else None
+
 
 def extract_email_from_creator(creator_field: str) -> Optional[str]:
     """
@@ -22,14 +181,18 @@ def extract_email_from_creator(creator_field: str) -> Optional[str]:
     if not creator_field:
         return None
     
+    # Fast path: the field is just an email address
+    plain_email = _match_plain_email(creator_field.strip())
+    if plain_email:
+        return plain_email
+    
     # Look for [mailto:email@domain.com] format first
-    mailto_match = re.search(r'\[mailto:([^\]]+)\]', creator_field, re.IGNORECASE)
+    mailto_match = _MAILTO_RE.search(creator_field)
     if mailto_match:
         return mailto_match.group(1).strip().lower()
     
     # Look for email pattern in the field
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, creator_field)
+    email_match = _EMAIL_RE.search(creator_field)
     if email_match:
         return email_match.group(0).strip().lower()
     
@@ -42,42 +205,28 @@ def normalize_execution_date(date_str: str) -> Optional[date]:
     """
     if not date_str:
         return None
+    return _parse_execution_date(date_str.strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_execution_date(date_str: str) -> Optional[date]:
+    """
+    Parse a stripped execution date string; cached because dates repeat heavily within an upload.
+    """
+    separator = '-' if '-' in date_str else '/'
+    year_first = date_str.find(separator) == 4
     
-    try:
-        # Try different date formats
-        date_formats = [
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%m-%d-%Y',
-            '%d/%m/%Y',
-            '%d-%m-%Y',
-            '%Y/%m/%d'
-        ]
-        
-        parsed_date = None
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt).date()
-                break
-            except ValueError:
-                continue
-        
-        if parsed_date is None:
-            return None
-            
-        # Convert to America/New_York timezone if needed
-        ny_tz = pytz.timezone('America/New_York')
-        # Create datetime at midnight in NY timezone
-        dt = datetime.combine(parsed_date, datetime.min.time())
-        dt_ny = ny_tz.localize(dt)
-        
-        return dt_ny.date()
-        
-    except Exception:
-        return None
+    for fmt in _EXECUTION_DATE_FORMATS_BY_SHAPE[(separator, year_first)]:
+        try:
+            # Execution dates are calendar dates in America/New_York, so no timezone conversion is needed
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    
+    return None
 
 
-@router.post("/uploads/performance")
+@router.post("/uploads/performance", response_class=ORJSONResponse)
 async def upload_performance_data(
     insertion_id: int = Query(..., description="Insertion ID for this performance data"),
     file: UploadFile = File(...),
@@ -89,52 +238,64 @@ async def upload_performance_data(
     Performance CSV expected columns: Creator, Clicks, Unique, Flagged, Execution Date, Status
     Decline CSV expected columns: Creator, Send Offer
     """
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV")
+    validate_csv_upload(file)
     
     # Verify insertion exists
     insertion = db.query(Insertion).filter(Insertion.insertion_id == insertion_id).first()
     if not insertion:
         raise HTTPException(status_code=404, detail="Insertion not found")
     
+    # Advertiser for declined-creator records, resolved once instead of lazy-loading insertion.campaign per row
+    advertiser_id = db.query(Campaign.advertiser_id).filter(
+        Campaign.campaign_id == insertion.campaign_id
+    ).scalar()
+    
     try:
-        # Read CSV content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Stream CSV rows straight from the upload
+        csv_reader = csv.reader(iter_csv_lines(file))
         
         # Detect CSV type based on column presence
-        csv_columns = csv_reader.fieldnames or []
-        print(f"DEBUG: CSV columns found: {csv_columns}")
+        csv_columns = next(csv_reader, [])
+        logger.debug("CSV columns found: %s", csv_columns)
+        
+        # Resolve column positions once (case-insensitive) so rows are read by index
+        col_idx = {col.lower(): index for index, col in enumerate(csv_columns)}
+        creator_col = col_idx.get('creator')
+        clicks_col = col_idx.get('clicks')
+        unique_col = col_idx.get('unique')
+        flagged_col = col_idx.get('flagged')
+        execution_date_col = col_idx.get('execution date')
+        status_col = col_idx.get('status')
+        offer_email_col = col_idx.get('offer email')
         
         # Check for performance columns (case-insensitive)
-        clicks_col = any(col.lower() == 'clicks' for col in csv_columns)
-        unique_col = any(col.lower() == 'unique' for col in csv_columns)
-        execution_date_col = any(col.lower() == 'execution date' for col in csv_columns)
-        is_performance_csv = clicks_col and unique_col and execution_date_col
+        is_performance_csv = clicks_col is not None and unique_col is not None and execution_date_col is not None
         
         # Check for decline columns (case-insensitive)
-        offer_email_col = any(col.lower() == 'offer email' for col in csv_columns)
-        is_decline_csv = offer_email_col
-        
-        print(f"DEBUG: CSV type detection - Performance: {is_performance_csv}, Decline: {is_decline_csv}")
+        is_decline_csv = offer_email_col is not None
         
         if not is_performance_csv and not is_decline_csv:
             raise HTTPException(status_code=400, detail=f"CSV must contain either performance columns (Clicks, Unique, Execution Date) or decline columns (Offer email). Found columns: {csv_columns}")
         
-        print(f"DEBUG: Final CSV type - Performance: {is_performance_csv}, Decline: {is_decline_csv}")
-        print(f"DEBUG: Starting performance upload for insertion {insertion_id} with duplicate detection enabled")
+        logger.debug("CSV type detection - Performance: %s, Decline: %s", is_performance_csv, is_decline_csv)
         
         inserted_rows = 0
         replaced_rows = 0
         unmatched_count = 0
         unmatched_examples = []
         declined_count = 0
+        # click_uniques rows in CLICK_UNIQUE_COLUMNS order, written in bulk after the loop
+        click_rows: List[tuple] = []
+        # creator_id -> DeclinedCreator values, inserted in bulk after the loop
+        declined_batch: Dict[int, Dict[str, Any]] = {}
+        
+        # Captured once so the upload row and every decline reason agree on the upload time
+        uploaded_at = datetime.now(timezone.utc)
         
         # Create perf_upload record
         perf_upload = PerfUpload(
             insertion_id=insertion_id,
-            uploaded_at=datetime.utcnow(),
+            uploaded_at=uploaded_at,
             filename=file.filename
         )
         db.add(perf_upload)
@@ -143,22 +304,27 @@ async def upload_performance_data(
         # Delete existing performance data for this insertion to replace with new data (only for performance CSV)
         replaced_rows = 0
         if is_performance_csv:
-            existing_click_uniques = db.query(ClickUnique).filter(
-                ClickUnique.perf_upload_id.in_(
-                    db.query(PerfUpload.perf_upload_id).filter(PerfUpload.insertion_id == insertion_id)
+            # Single DELETE statement instead of loading every row and deleting one by one
+            delete_result = db.execute(
+                delete(ClickUnique)
+                .where(
+                    ClickUnique.perf_upload_id.in_(
+                        select(PerfUpload.perf_upload_id).where(PerfUpload.insertion_id == insertion_id)
+                    )
                 )
-            ).all()
-            
-            replaced_rows = len(existing_click_uniques)
-            for click_unique in existing_click_uniques:
-                db.delete(click_unique)
+                .execution_options(synchronize_session=False)
+            )
+            replaced_rows = delete_result.rowcount
             
-            print(f"DEBUG: Deleted {replaced_rows} existing performance records for insertion {insertion_id}")
+            logger.debug("Deleted %d existing performance records for insertion %s", replaced_rows, insertion_id)
         
+        # First pass: parse every row; creators are resolved for all rows at once afterwards.
+        # Each entry is (creator_field, creator_email, payload); payload is None for rows that produce nothing.
+        parsed_rows = []
         for row in csv_reader:
             try:
                 # Extract data from CSV row - get Creator column case-insensitively
-                creator_field = next((row.get(col, '') for col in csv_columns if col.lower() == 'creator'), '').strip()
+                creator_field = _cell(row, creator_col)
                 
                 # Skip rows with missing creator field
                 if not creator_field:
@@ -166,145 +332,108 @@ async def upload_performance_data(
                 
                 # Extract email from creator field
                 creator_email = extract_email_from_creator(creator_field)
-                if not creator_email:
-                    unmatched_count += 1
-                    unmatched_examples.append(creator_field[:50])  # First 50 chars
-                    continue
-                
-                # Find creator by email
-                creator = db.query(Creator).filter(
-                    func.lower(Creator.owner_email) == creator_email
-                ).first()
-                
-                if not creator:
-                    unmatched_count += 1
-                    unmatched_examples.append(f"{creator_field[:30]} -> {creator_email}")
-                    continue
-                
-                # Process based on CSV type
-                if is_performance_csv:
-                    # Performance CSV processing - get columns case-insensitively
-                    clicks_str = next((row.get(col, '') for col in csv_columns if col.lower() == 'clicks'), '').strip()
-                    unique_str = next((row.get(col, '') for col in csv_columns if col.lower() == 'unique'), '').strip()
-                    flagged_str = next((row.get(col, '') for col in csv_columns if col.lower() == 'flagged'), '').strip()
-                    execution_date_str = next((row.get(col, '') for col in csv_columns if col.lower() == 'execution date'), '').strip()
-                    status = next((row.get(col, '') for col in csv_columns if col.lower() == 'status'), '').strip()
-                    
-                    # Skip rows with "unscheduled" status - these should not be stored or used in forecasts
-                    if status and status.lower() == "unscheduled":
-                        print(f"DEBUG: Skipping unscheduled row for creator {creator.name}")
-                        continue
-                    
-                    # Skip rows with missing required performance fields
-                    if not unique_str or not execution_date_str:
-                        continue
-                    
-                    # Parse numeric values
-                    try:
-                        unique_clicks = int(unique_str) if unique_str else 0
-                        raw_clicks = int(clicks_str) if clicks_str else None
-                    except ValueError:
-                        continue
-                    
-                    # Parse flagged as boolean
-                    flagged = None
-                    if flagged_str.lower() in ['true', '1', 'yes', 'y']:
-                        flagged = True
-                    elif flagged_str.lower() in ['false', '0', 'no', 'n']:
-                        flagged = False
-                    
-                    # Normalize execution date
-                    execution_date = normalize_execution_date(execution_date_str)
-                    if not execution_date:
-                        continue
-                    
-                    # Check for existing click data for same creator/insertion/date and delete it
-                    existing_clicks = db.query(ClickUnique).join(PerfUpload).filter(
-                        ClickUnique.creator_id == creator.creator_id,
-                        PerfUpload.insertion_id == insertion_id,
-                        ClickUnique.execution_date == execution_date
-                    ).all()
-                    
-                    if existing_clicks:
-                        print(f"DEBUG: Found {len(existing_clicks)} existing click records for creator {creator.creator_id} on {execution_date} - deleting duplicates")
-                        for existing_click in existing_clicks:
-                            db.delete(existing_click)
-                        replaced_rows += len(existing_clicks)
-                    
-                    # Create click_unique record
-                    click_unique = ClickUnique(
-                        perf_upload_id=perf_upload.perf_upload_id,
-                        creator_id=creator.creator_id,
-                        execution_date=execution_date,
-                        unique_clicks=unique_clicks,
-                        raw_clicks=raw_clicks,
-                        flagged=flagged,
-                        status=status if status else None
-                    )
-                    db.add(click_unique)
-                    inserted_rows += 1
-                    
-                    # Check if status is "declined" and record it (existing logic preserved)
-                    if status and status.lower() == "declined":
-                        # Get advertiser_id from the insertion's campaign
-                        advertiser_id = insertion.campaign.advertiser_id
-                        
-                        # Check if this creator-advertiser combination is already declined
-                        existing_decline = db.query(DeclinedCreator).filter(
-                            DeclinedCreator.creator_id == creator.creator_id,
-                            DeclinedCreator.advertiser_id == advertiser_id
-                        ).first()
-                        
-                        if not existing_decline:
-                            # Record the declined creator-advertiser combination
-                            declined_creator = DeclinedCreator(
-                                creator_id=creator.creator_id,
-                                advertiser_id=advertiser_id,
-                                reason=f"Declined from performance upload on {execution_date}"
-                            )
-                            db.add(declined_creator)
-                            declined_count += 1
-                
-                elif is_decline_csv:
-                    # Decline CSV processing - get column case-insensitively
-                    offer_email = next((row.get(col, '') for col in csv_columns if col.lower() == 'offer email'), '').strip()
-                    
-                    # Skip rows with missing Offer email field
-                    if not offer_email:
-                        continue
-                    
-                    # Check if Offer email is "declined"
-                    if offer_email.lower() == "declined":
-                        # Get advertiser_id from the insertion's campaign
-                        advertiser_id = insertion.campaign.advertiser_id
-                        
-                        # Check if this creator-advertiser combination is already declined
-                        existing_decline = db.query(DeclinedCreator).filter(
-                            DeclinedCreator.creator_id == creator.creator_id,
-                            DeclinedCreator.advertiser_id == advertiser_id
-                        ).first()
-                        
-                        if not existing_decline:
-                            # Record the declined creator-advertiser combination
-                            declined_creator = DeclinedCreator(
-                                creator_id=creator.creator_id,
-                                advertiser_id=advertiser_id,
-                                reason=f"Declined from decline upload on {datetime.utcnow().date()}"
-                            )
-                            db.add(declined_creator)
-                            declined_count += 1
+                payload = None
+                if creator_email:
+                    if is_performance_csv:
+                        payload = _parse_click_fields(
+                            row, clicks_col, unique_col, flagged_col, execution_date_col, status_col
+                        )
+                    elif is_decline_csv:
+                        # Only rows whose Offer email is "declined" are recorded
+                        if _cell(row, offer_email_col).lower() == "declined":
+                            payload = True
+                parsed_rows.append((creator_field, creator_email, payload))
                 
             except Exception as e:
                 # Skip rows that cause errors
                 continue
         
+        # Resolve all creator emails in the file with a single query
+        creator_emails = {creator_email for _, creator_email, _ in parsed_rows if creator_email}
+        creator_ids_by_email = dict(
+            db.query(func.lower(Creator.owner_email), Creator.creator_id)
+            .filter(func.lower(Creator.owner_email).in_(list(creator_emails)))
+            .all()
+        ) if creator_emails else {}
+        
+        # Second pass: pure dict lookups
+        for creator_field, creator_email, payload in parsed_rows:
+            if not creator_email:
+                unmatched_count += 1
+                unmatched_examples.append(creator_field[:50])  # First 50 chars
+                continue
+            
+            creator_id = creator_ids_by_email.get(creator_email)
+            if creator_id is None:
+                unmatched_count += 1
+                unmatched_examples.append(f"{creator_field[:30]} -> {creator_email}")
+                continue
+            
+            if payload is None:
+                continue
+            
+            # Process based on CSV type
+            if is_performance_csv:
+                execution_date, unique_clicks, raw_clicks, flagged, status = payload
+                
+                # Queue click_unique record (existing clicks for this insertion were already deleted above)
+                click_rows.append((
+                    perf_upload.perf_upload_id,
+                    creator_id,
+                    execution_date,
+                    unique_clicks,
+                    raw_clicks,
+                    flagged,
+                    status
+                ))
+                
+                # Check if status is "declined" and record it (existing logic preserved)
+                if status and status.lower() == "declined":
+                    # Queue the declined creator-advertiser combination; existing ones are skipped on insert
+                    declined_batch.setdefault(creator_id, {
+                        "creator_id": creator_id,
+                        "advertiser_id": advertiser_id,
+                        "reason": f"Declined from performance upload on {execution_date}"
+                    })
+            
+            elif is_decline_csv:
+                # Queue the declined creator-advertiser combination; existing ones are skipped on insert
+                declined_batch.setdefault(creator_id, {
+                    "creator_id": creator_id,
+                    "advertiser_id": advertiser_id,
+                    "reason": f"Declined from decline upload on {uploaded_at.date()}"
+                })
+        
+        if click_rows:
+            write_click_uniques(db, click_rows)
+            inserted_rows = len(click_rows)
+        
+        if declined_batch:
+            # Core executemany INSERT for all declines, paged by insertmanyvalues; the unique
+            # (creator_id, advertiser_id) constraint skips known ones, so only new rows are returned
+            declined_table = DeclinedCreator.__table__
+            declined_result = db.execute(
+                pg_insert(declined_table)
+                .on_conflict_do_nothing(index_elements=["creator_id", "advertiser_id"])
+                .returning(declined_table.c.creator_id),
+                list(declined_batch.values())
+            )
+            declined_count = len(declined_result.scalars().all())
+        
+        # Replaced clicks must leave the rollup even when no new row was inserted
+        if replaced_rows or click_rows:
+            refresh_creator_performance_rollup(db)
+        
         # Commit all changes
         db.commit()
         
         # Limit unmatched examples to first 10
         unmatched_examples = unmatched_examples[:10]
         
-        print(f"DEBUG: Upload completed - Inserted: {inserted_rows}, Replaced: {replaced_rows}, Unmatched: {unmatched_count}, Declined: {declined_count}")
+        logger.info(
+            "Performance upload %s completed - Inserted: %d, Replaced: %d, Unmatched: %d, Declined: %d",
+            perf_upload.perf_upload_id, inserted_rows, replaced_rows, unmatched_count, declined_count
+        )
         
         return {
             "perf_upload_id": perf_upload.perf_upload_id,
@@ -316,12 +445,15 @@ async def upload_performance_data(
             "declined_count": declined_count
         }
         
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error processing CSV: {str(e)}")
 
 
-@router.post("/uploads/conversions")
+@router.post("/uploads/conversions", response_class=ORJSONResponse)
 async def upload_conversions_data(
     advertiser_id: int = Query(..., description="Advertiser ID"),
     campaign_id: int = Query(..., description="Campaign ID"),
@@ -335,8 +467,7 @@ async def upload_conversions_data(
     Upload conversions CSV data for a specific insertion.
     Expected columns: Acct Id, Conversions
     """
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV")
+    validate_csv_upload(file)
     
     # Parse date range
     try:
@@ -359,13 +490,13 @@ async def upload_conversions_data(
         raise HTTPException(status_code=404, detail="Insertion not found")
     
     try:
-        # Read CSV content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
+        # Stream CSV rows straight from the upload
+        csv_reader = csv.reader(iter_csv_lines(file))
         
-        # Parse CSV once and get all rows
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-        csv_rows = list(csv_reader)
+        # Resolve the acct id / conversions column positions once instead of per row
+        col_idx = {col.lower(): index for index, col in enumerate(next(csv_reader, []))}
+        acct_id_col = col_idx.get('acct id', col_idx.get('acct_id'))
+        conversions_col = col_idx.get('conversions')
         
         replaced_rows = 0
         inserted_rows = 0
@@ -375,7 +506,7 @@ async def upload_conversions_data(
             advertiser_id=advertiser_id,
             campaign_id=campaign_id,
             insertion_id=insertion_id,
-            uploaded_at=datetime.utcnow(),
+            uploaded_at=datetime.now(timezone.utc),
             filename=file.filename,
             range_start=start_date,
             range_end=end_date,
@@ -384,122 +515,101 @@ async def upload_conversions_data(
         db.add(conv_upload)
         db.flush()  # Get the ID without committing
         
+        # acct_id -> conversions for every valid row; last row wins if an acct_id repeats
+        parsed_conversions: Dict[str, int] = {}
+        
         # Process each row in the CSV
-        for row_index, row in enumerate(csv_rows):
-            print(f"DEBUG: Processing row {row_index + 1}")
+        for row_index, row in enumerate(csv_reader):
             try:
                 # Handle both original and standardized headers
-                acct_id = row.get('Acct ID', row.get('Acct Id', row.get('acct_id', ''))).strip()
-                conversions_str = row.get('Conversions', row.get('conversions', '')).strip()
-                print(f"DEBUG: Row {row_index + 1} - acct_id: '{acct_id}', conversions: '{conversions_str}'")
+                acct_id = _cell(row, acct_id_col)
+                conversions_str = _cell(row, conversions_col)
                 
                 # Skip rows with missing required fields
                 if not acct_id or not conversions_str:
-                    print(f"DEBUG: Row {row_index + 1} - Skipping due to missing fields")
                     continue
                 
                 # Skip header rows
                 if acct_id in ['Acct ID', 'Acct Id', 'acct_id'] or conversions_str in ['Conversions', 'conversions']:
-                    print(f"DEBUG: Row {row_index + 1} - Skipping header row")
                     continue
                 
-                # Find creator by acct_id
-                print(f"DEBUG: Row {row_index + 1} - Looking for creator with acct_id: '{acct_id}'")
-                creator = db.query(Creator).filter(Creator.acct_id == acct_id).first()
-                if not creator:
-                    print(f"DEBUG: Row {row_index + 1} - No creator found for acct_id: '{acct_id}'")
-                    continue
-                print(f"DEBUG: Row {row_index + 1} - Found creator: {creator.creator_id}")
-                
                 # Parse conversions count
                 try:
-                    conversions = int(conversions_str)
-                    print(f"DEBUG: Row {row_index + 1} - Parsed conversions: {conversions}")
-                except ValueError as e:
-                    print(f"DEBUG: Row {row_index + 1} - Error parsing conversions: {e}")
+                    parsed_conversions[acct_id] = int(conversions_str)
+                except ValueError:
                     continue
                 
-                # Delete existing conversions for this creator/insertion
-                print(f"DEBUG: Row {row_index + 1} - Looking for existing conversions for creator {creator.creator_id}, insertion {insertion_id}")
-                existing_conversions = db.query(Conversion).filter(
-                    Conversion.creator_id == creator.creator_id,
-                    Conversion.insertion_id == insertion_id
-                ).all()
-                print(f"DEBUG: Row {row_index + 1} - Found {len(existing_conversions)} existing conversions")
-                
-                for conv in existing_conversions:
-                    print(f"DEBUG: Row {row_index + 1} - Deleting conversion {conv.conversion_id} with period {conv.period}")
-                    db.delete(conv)
-                replaced_rows += len(existing_conversions)
-                print(f"DEBUG: Row {row_index + 1} - Deleted {len(existing_conversions)} conversions")
-                
-                # Commit the deletions before inserting new ones
-                db.commit()
-                print(f"DEBUG: Row {row_index + 1} - Committed deletions")
-                
-                # Create daterange for the period
-                period_range = f"[{start_date},{end_date}]"
-                print(f"DEBUG: Row {row_index + 1} - Created period_range: {period_range}")
-                
-                # Insert new conversion record
-                print(f"DEBUG: Row {row_index + 1} - Creating new conversion record")
-                conversion = Conversion(
-                    conv_upload_id=conv_upload.conv_upload_id,
-                    insertion_id=insertion_id,
-                    creator_id=creator.creator_id,
-                    period=period_range,
-                    conversions=conversions
-                )
-                db.add(conversion)
-                print(f"DEBUG: Row {row_index + 1} - Added conversion to session")
-                
-                # Flush to catch any immediate errors
-                try:
-                    db.flush()
-                    print(f"DEBUG: Row {row_index + 1} - Flush successful")
-                except Exception as flush_error:
-                    print(f"DEBUG: Row {row_index + 1} - Flush failed: {flush_error}")
-                    print(f"DEBUG: Row {row_index + 1} - Conversion data: creator_id={creator.creator_id}, insertion_id={insertion_id}, period={period_range}, conversions={conversions}")
-                    raise
-                
-                inserted_rows += 1
-                print(f"DEBUG: Row {row_index + 1} - Successfully processed, inserted_rows now: {inserted_rows}")
-                
-                # Debug: Verify the conversion was actually saved
-                # Note: We can't directly compare DATERANGE with string, so we'll check by creator and insertion
-                saved_conversion = db.query(Conversion).filter(
-                    Conversion.creator_id == creator.creator_id,
-                    Conversion.insertion_id == insertion_id
-                ).first()
-                print(f"DEBUG: Row {row_index + 1} - Verification: Conversion saved with ID {saved_conversion.conversion_id if saved_conversion else 'NOT FOUND'}")
-                if saved_conversion:
-                    print(f"DEBUG: Row {row_index + 1} - Verification: Period {saved_conversion.period}, Conversions {saved_conversion.conversions}")
-                
-                # Debug: Check if the conversion actually exists in the database after commit
-                db.commit()  # Ensure the conversion is committed
-                committed_conversion = db.query(Conversion).filter(
-                    Conversion.creator_id == creator.creator_id,
-                    Conversion.insertion_id == insertion_id
-                ).first()
-                print(f"DEBUG: Row {row_index + 1} - Post-commit verification: Conversion ID {committed_conversion.conversion_id if committed_conversion else 'NOT FOUND'}")
-                
             except Exception as e:
-                print(f"DEBUG: Row {row_index + 1} - ERROR: {e}")
-                print(f"DEBUG: Row {row_index + 1} - Exception type: {type(e)}")
-                import traceback
-                print(f"DEBUG: Row {row_index + 1} - Traceback: {traceback.format_exc()}")
+                logger.debug("Row %d - skipped: %s", row_index + 1, e)
                 # Skip rows that cause errors
                 continue
         
-        # All changes are already committed per row
+        # Resolve acct_ids to creators in bounded batches rather than one unbounded IN list
+        creator_ids_by_acct: Dict[str, int] = {}
+        acct_ids = list(parsed_conversions)
+        for batch_start in range(0, len(acct_ids), CSV_LOOKUP_BATCH_SIZE):
+            creator_ids_by_acct.update(
+                db.query(Creator.acct_id, Creator.creator_id)
+                .filter(Creator.acct_id.in_(acct_ids[batch_start:batch_start + CSV_LOOKUP_BATCH_SIZE]))
+                .all()
+            )
+        
+        # creator_id -> conversions for every matched row
+        new_conversions: Dict[int, int] = {
+            creator_ids_by_acct[acct_id]: conversions
+            for acct_id, conversions in parsed_conversions.items()
+            if acct_id in creator_ids_by_acct
+        }
+        logger.debug(
+            "Matched %d of %d acct_ids to creators", len(new_conversions), len(parsed_conversions)
+        )
         
-        # Debug: Final verification of what was actually saved
-        final_conversions = db.query(Conversion).filter(
-            Conversion.conv_upload_id == conv_upload.conv_upload_id
-        ).all()
-        print(f"DEBUG: FINAL - Total conversions saved for this upload: {len(final_conversions)}")
-        for conv in final_conversions:
-            print(f"DEBUG: FINAL - Conversion ID {conv.conversion_id}: Creator {conv.creator_id}, Period {conv.period}, Conversions {conv.conversions}")
+        if new_conversions:
+            creator_ids = list(new_conversions)
+            
+            # Replace conversions overlapping the upload period for every matched creator in one statement;
+            # the ids travel as a single array parameter instead of one bind parameter per creator
+            delete_result = db.execute(
+                delete(Conversion)
+                .where(
+                    Conversion.insertion_id == insertion_id,
+                    Conversion.creator_id == any_(bindparam('creator_ids', creator_ids, type_=ARRAY(Integer))),
+                    Conversion.period.overlaps(func.daterange(start_date, end_date, '[]'))
+                )
+                .execution_options(synchronize_session=False)
+            )
+            replaced_rows = delete_result.rowcount
+            
+            # Insert all new conversion records from parallel arrays; unnest keeps planning cost
+            # constant regardless of row count and avoids the bind-parameter limit of multi-row VALUES
+            db.execute(
+                text("""
+                    INSERT INTO conversions (conv_upload_id, insertion_id, creator_id, period, conversions)
+                    SELECT :conv_upload_id, :insertion_id, t.creator_id,
+                           daterange(CAST(:range_start AS date), CAST(:range_end AS date), '[]'), t.conversions
+                    FROM unnest(CAST(:creator_ids AS integer[]), CAST(:conversions AS integer[]))
+                         AS t(creator_id, conversions)
+                """),
+                {
+                    "conv_upload_id": conv_upload.conv_upload_id,
+                    "insertion_id": insertion_id,
+                    "range_start": start_date,
+                    "range_end": end_date,
+                    "creator_ids": creator_ids,
+                    "conversions": list(new_conversions.values())
+                }
+            )
+            inserted_rows = len(new_conversions)
+        
+        refresh_creator_performance_rollup(db)
+        
+        # Single commit for the whole upload
+        db.commit()
+        
+        logger.info(
+            "Conversions upload %s completed - Inserted: %d, Replaced: %d",
+            conv_upload.conv_upload_id, inserted_rows, replaced_rows
+        )
         
         return {
             "conv_upload_id": conv_upload.conv_upload_id,
@@ -507,6 +617,9 @@ async def upload_conversions_data(
             "inserted_rows": inserted_rows
         }
         
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error processing CSV: {str(e)}")
@@ -519,39 +632,36 @@ async def cleanup_performance_data(
     """
     Clean up all performance and conversion data for testing.
     WARNING: This will delete ALL click and conversion data!
+    Returned record counts are the planner's row estimates taken just before the TRUNCATE.
     """
     try:
-        print("DEBUG: CLEANUP - Starting performance data cleanup")
-        
-        # Delete all click data
-        click_count = db.query(ClickUnique).count()
-        db.query(ClickUnique).delete()
-        print(f"DEBUG: CLEANUP - Deleted {click_count} click records")
-        
-        # Delete all performance uploads
-        perf_upload_count = db.query(PerfUpload).count()
-        db.query(PerfUpload).delete()
-        print(f"DEBUG: CLEANUP - Deleted {perf_upload_count} performance upload records")
-        
-        # Delete all conversion data
-        conversion_count = db.query(Conversion).count()
-        db.query(Conversion).delete()
-        print(f"DEBUG: CLEANUP - Deleted {conversion_count} conversion records")
-        
-        # Delete all conversion uploads
-        conv_upload_count = db.query(ConvUpload).count()
-        db.query(ConvUpload).delete()
-        print(f"DEBUG: CLEANUP - Deleted {conv_upload_count} conversion upload records")
-        
-        # Delete all decline data
-        declined_count = db.query(DeclinedCreator).count()
-        db.query(DeclinedCreator).delete()
-        print(f"DEBUG: CLEANUP - Deleted {declined_count} declined creator records")
+        # Row estimates from table statistics; avoids a full count(*) scan per table
+        estimates = dict(db.execute(text("""
+            SELECT relname, GREATEST(reltuples, 0)::bigint
+            FROM pg_class
+            WHERE relkind = 'r'
+              AND relnamespace = 'public'::regnamespace
+              AND relname IN ('click_uniques', 'perf_uploads', 'conversions', 'conv_uploads', 'declined_creators')
+        """)).all())
+        click_count = estimates.get('click_uniques', 0)
+        perf_upload_count = estimates.get('perf_uploads', 0)
+        conversion_count = estimates.get('conversions', 0)
+        conv_upload_count = estimates.get('conv_uploads', 0)
+        declined_count = estimates.get('declined_creators', 0)
+        
+        # Empty every performance/conversion/decline table in one statement
+        db.execute(text(
+            "TRUNCATE TABLE click_uniques, perf_uploads, conversions, conv_uploads, declined_creators RESTART IDENTITY"
+        ))
+        refresh_creator_performance_rollup(db)
         
         # Commit the cleanup
         db.commit()
         
-        print("DEBUG: CLEANUP - Performance data cleanup completed successfully")
+        logger.info(
+            "Performance data cleanup completed - clicks: %d, perf_uploads: %d, conversions: %d, conv_uploads: %d, declined_creators: %d",
+            click_count, perf_upload_count, conversion_count, conv_upload_count, declined_count
+        )
         
         return {
             "status": "success",
@@ -567,11 +677,11 @@ async def cleanup_performance_data(
         
     except Exception as e:
         db.rollback()
-        print(f"DEBUG: CLEANUP - Error during cleanup: {e}")
+        logger.error("Error during performance data cleanup: %s", e)
         raise HTTPException(status_code=500, detail=f"Cleanup failed: {str(e)}")
 
 
-@router.post("/vectors")
+@router.post("/vectors", response_class=ORJSONResponse)
 async def upload_vectors(
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
@@ -580,13 +690,15 @@ async def upload_vectors(
     Upload creator vectors from CSV file.
     Expected CSV format: account_id, vector_component_1, vector_component_2, ..., vector_component_n
     """
+    validate_csv_upload(file)
+    
     try:
-        print(f"DEBUG: Vector upload started - {file.filename}")
+        logger.info("Vector upload started - %s", file.filename)
         
-        # Read and parse CSV
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Stream CSV rows and resolve the account_id position from the header
+        csv_reader = csv.reader(iter_csv_lines(file))
+        headers = next(csv_reader, [])
+        account_id_index = headers.index('account_id') if 'account_id' in headers else None
         
         uploaded_count = 0
         updated_count = 0
@@ -595,113 +707,92 @@ async def upload_vectors(
         
         # Batch processing for speed - collect all data first
         batch_data = []
-        creator_lookup = {}
         
-        # Pre-fetch all creators for faster lookup
-        print("DEBUG: Pre-fetching creators for batch processing...")
-        all_creators = db.query(Creator).all()
-        creator_lookup = {creator.acct_id: creator for creator in all_creators}
-        print(f"DEBUG: Loaded {len(creator_lookup)} creators for lookup")
+        # Pre-fetch acct_id -> creator_id for all creators; only the id is needed, so skip ORM hydration
+        creator_ids_by_acct = dict(db.query(Creator.acct_id, Creator.creator_id).all())
+        logger.debug("Loaded %d creators for lookup", len(creator_ids_by_acct))
         
         # Process all rows first
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 because header is row 1
             try:
                 # Get account_id
-                account_id = row.get('account_id')
-                print(f"DEBUG: Row {row_num} - account_id: '{account_id}'")
+                if not row:
+                    continue
+                account_id = _cell(row, account_id_index)
                 if not account_id:
                     errors.append(f"Row {row_num}: Missing account_id")
                     skipped_count += 1
                     continue
                 
                 # Find creator by account_id (using pre-fetched lookup)
-                creator = creator_lookup.get(account_id)
-                print(f"DEBUG: Row {row_num} - creator found: {creator is not None}")
-                if not creator:
+                creator_id = creator_ids_by_acct.get(account_id)
+                if creator_id is None:
                     errors.append(f"Row {row_num}: Creator with account_id '{account_id}' not found")
                     skipped_count += 1
                     continue
                 
-                # Extract vector components (all columns except account_id)
-                vector_components = []
-                print(f"DEBUG: Row {row_num} - CSV columns: {list(row.keys())}")
-                for key, value in row.items():
-                    if key != 'account_id' and value.strip():
-                        # Check if this is a Python list format [0.1, 0.2, ...]
-                        if value.strip().startswith('[') and value.strip().endswith(']'):
-                            try:
-                                # Parse Python list format
-                                import ast
-                                vector_list = ast.literal_eval(value.strip())
-                                if isinstance(vector_list, list):
-                                    vector_components.extend([float(x) for x in vector_list])
-                                    print(f"DEBUG: Row {row_num} - Parsed list with {len(vector_list)} components")
-                                else:
-                                    errors.append(f"Row {row_num}: Invalid list format '{value}' for column '{key}'")
-                                    break
-                            except (ValueError, SyntaxError) as e:
-                                errors.append(f"Row {row_num}: Invalid list format '{value}' for column '{key}': {e}")
-                                break
-                        else:
-                            # Regular single value
-                            try:
-                                vector_components.append(float(value))
-                            except ValueError:
-                                errors.append(f"Row {row_num}: Invalid vector component '{value}' for column '{key}'")
-                                break
-                else:
-                    # All vector components parsed successfully
-                    print(f"DEBUG: Row {row_num} - vector components: {len(vector_components)}")
-                    if not vector_components:
-                        errors.append(f"Row {row_num}: No vector components found")
-                        skipped_count += 1
+                # Collect vector component strings (all columns except account_id); cells in
+                # Python list format [0.1, 0.2, ...] contribute each of their elements
+                component_strs = []
+                for index, value in enumerate(row):
+                    value = value.strip()
+                    if index == account_id_index or not value:
                         continue
-                    
-                    vector_dimension = len(vector_components)
-                    batch_data.append({
-                        'creator_id': creator.creator_id,
-                        'vector': vector_components,
-                        'vector_dimension': vector_dimension,
-                        'creator_name': creator.name
-                    })
-                    print(f"DEBUG: Row {row_num} - Added to batch: creator_id={creator.creator_id}, dimension={vector_dimension}")
+                    if value.startswith('[') and value.endswith(']'):
+                        inner = value[1:-1].strip()
+                        if inner:
+                            component_strs.extend(inner.split(','))
+                    else:
+                        component_strs.append(value)
+                
+                if not component_strs:
+                    errors.append(f"Row {row_num}: No vector components found")
+                    skipped_count += 1
+                    continue
+                
+                # Convert the whole row in one NumPy call instead of float() per component
+                try:
+                    vector_components = np.array(component_strs, dtype=np.float64)
+                except ValueError as e:
+                    errors.append(f"Row {row_num}: Invalid vector component: {e}")
+                    continue
+                
+                batch_data.append({
+                    'creator_id': creator_id,
+                    'vector': vector_components.tolist(),
+                    'vector_dimension': int(vector_components.size)
+                })
                 
             except Exception as e:
                 errors.append(f"Row {row_num}: {str(e)}")
                 skipped_count += 1
-                print(f"DEBUG: Error processing row {row_num}: {e}")
-        
-        # Batch database operations
-        print(f"DEBUG: Processing {len(batch_data)} vectors in batch...")
-        
-        # Get existing vectors for batch update
-        creator_ids = [item['creator_id'] for item in batch_data]
-        existing_vectors = {v.creator_id: v for v in db.query(CreatorVector).filter(CreatorVector.creator_id.in_(creator_ids)).all()}
-        
-        # Process batch
-        for item in batch_data:
-            creator_id = item['creator_id']
-            if creator_id in existing_vectors:
-                # Update existing vector
-                existing_vectors[creator_id].vector = item['vector']
-                existing_vectors[creator_id].vector_dimension = item['vector_dimension']
-                existing_vectors[creator_id].updated_at = datetime.now(pytz.UTC)
-                updated_count += 1
-            else:
-                # Create new vector
-                new_vector = CreatorVector(
-                    creator_id=creator_id,
-                    vector=item['vector'],
-                    vector_dimension=item['vector_dimension']
-                )
-                db.add(new_vector)
-                uploaded_count += 1
+                logger.debug("Error processing vector row %d: %s", row_num, e)
+        
+        # Upsert the whole batch in one INSERT ... ON CONFLICT statement; a creator may only
+        # appear once per statement, so later rows for the same creator win
+        vectors_by_creator = {item['creator_id']: item for item in batch_data}
+        if vectors_by_creator:
+            stmt = pg_insert(CreatorVector.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['creator_id'],
+                set_={
+                    'vector': stmt.excluded.vector,
+                    'vector_dimension': stmt.excluded.vector_dimension,
+                    'updated_at': func.now()
+                }
+            ).returning(literal_column('xmax = 0').label('inserted'))
+            # xmax is 0 only for freshly inserted rows, which separates creates from updates
+            inserted_flags = db.execute(stmt, list(vectors_by_creator.values())).scalars().all()
+            uploaded_count = sum(1 for inserted in inserted_flags if inserted)
+            updated_count = len(inserted_flags) - uploaded_count
         
         # Single commit for all changes
-        print(f"DEBUG: Committing {len(batch_data)} vector operations...")
         db.commit()
         
-        print(f"DEBUG: Vector upload completed - {uploaded_count} created, {updated_count} updated, {skipped_count} skipped")
+        logger.info(
+            "Vector upload completed - %d created, %d updated, %d skipped",
+            uploaded_count, updated_count, skipped_count
+        )
         
         return {
             "status": "success",
@@ -716,7 +807,7 @@ async def upload_vectors(
         
     except Exception as e:
         db.rollback()
-        print(f"DEBUG: Vector upload error: {e}")
+        logger.error("Vector upload error: %s", e)
         raise HTTPException(status_code=500, detail=f"Vector upload failed: {str(e)}")
 
 
@@ -727,8 +818,6 @@ async def create_vectors_table(db: Session = Depends(get_db)) -> Dict[str, Any]:
     Use this if migrations aren't working.
     """
     try:
-        print("DEBUG: Creating creator_vectors table...")
-        
         # Check if table already exists
         from sqlalchemy import text
         result = db.execute(text("""
@@ -750,7 +839,7 @@ async def create_vectors_table(db: Session = Depends(get_db)) -> Dict[str, Any]:
         db.execute(text("""
             CREATE TABLE creator_vectors (
                 creator_id INTEGER NOT NULL,
-                vector NUMERIC[] NOT NULL,
+                vector REAL[] NOT NULL,
                 vector_dimension INTEGER NOT NULL,
                 created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
                 updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
@@ -762,7 +851,7 @@ async def create_vectors_table(db: Session = Depends(get_db)) -> Dict[str, Any]:
         
         db.commit()
         
-        print("DEBUG: creator_vectors table created successfully")
+        logger.info("creator_vectors table created successfully")
         
         return {
             "status": "success",
@@ -772,5 +861,5 @@ async def create_vectors_table(db: Session = Depends(get_db)) -> Dict[str, Any]:
         
     except Exception as e:
         db.rollback()
-        print(f"DEBUG: Error creating table: {e}")
+        logger.error("Error creating creator_vectors table: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create table: {str(e)}")
@@ -1,7 +1,16 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List, Dict, Any
-from datetime import date
-from decimal import Decimal
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, WithJsonSchema
+from pydantic.networks import validate_email
+from typing import Annotated, Optional, List, Dict, Any
+from datetime import date, datetime
+
+
+def _validate_email(value: str) -> str:
+    """Validate and normalize an email address; email-validator is imported on first use."""
+    return validate_email(value)[1]
+
+
+# Same validation and JSON schema as EmailStr, which imports email-validator when the model is built
+LazyEmailStr = Annotated[str, AfterValidator(_validate_email), WithJsonSchema({'type': 'string', 'format': 'email'})]
 
 
 class AdvertiserIn(BaseModel):
@@ -14,8 +23,7 @@ class AdvertiserOut(BaseModel):
     name: str
     category: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class CampaignIn(BaseModel):
@@ -34,15 +42,14 @@ class CampaignOut(BaseModel):
     end_date: date
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class InsertionIn(BaseModel):
     campaign_id: int
     month_start: date
     month_end: date
-    cpc: Decimal
+    cpc: float = Field(ge=0)
 
 
 class InsertionOut(BaseModel):
@@ -50,10 +57,9 @@ class InsertionOut(BaseModel):
     campaign_id: int
     month_start: date
     month_end: date
-    cpc: Decimal
+    cpc: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class CreatorOut(BaseModel):
@@ -62,11 +68,10 @@ class CreatorOut(BaseModel):
     acct_id: str
     owner_email: str
     topic: Optional[str] = None
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Analytics schemas
@@ -91,6 +96,8 @@ class PlanRequest(BaseModel):
     # Email export field
     email: Optional[str] = None
 
+    model_config = ConfigDict(hide_input_in_errors=True)
+
 
 class PlanCreator(BaseModel):
     creator_id: int
@@ -123,6 +130,10 @@ class PlanResponse(BaseModel):
     budget_utilization: float
 
 
+# Validator for stored plan creator lists, built once instead of per call
+PLAN_CREATOR_LIST_ADAPTER = TypeAdapter(List[PlanCreator])
+
+
 class LeaderboardEntry(BaseModel):
     creator_id: int
     name: str
@@ -154,6 +165,8 @@ class CampaignForecastRequest(BaseModel):
     avg_cpc: float
     lookback_days: int = 30
 
+    model_config = ConfigDict(hide_input_in_errors=True)
+
 
 class CampaignForecastResponse(BaseModel):
     historical_cvr: float
@@ -166,24 +179,27 @@ class CampaignForecastResponse(BaseModel):
 
 # Auth schemas
 class UserSignUp(BaseModel):
-    email: EmailStr
+    email: LazyEmailStr
     password: str
     name: Optional[str] = None
 
+    model_config = ConfigDict(hide_input_in_errors=True, str_max_length=2048)
+
 
 class UserSignIn(BaseModel):
-    email: EmailStr
+    email: str  # Only looked up against existing users, so no address validation
     password: str
 
+    model_config = ConfigDict(hide_input_in_errors=True, str_max_length=2048)
+
 
 class UserOut(BaseModel):
     user_id: int
     email: str
     name: Optional[str] = None
-    created_at: str
+    created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TokenResponse(BaseModel):
@@ -3,20 +3,48 @@ Smart creator matching algorithm for enhanced planner.
 Implements multi-tier selection strategy with budget optimization.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from app.models import (
-    Creator, Advertiser, Topic, Keyword, CreatorTopic, CreatorKeyword, 
-    CreatorSimilarity, ClickUnique, Conversion, PerfUpload, ConvUpload,
-    Insertion, Campaign
-)
-from app.topic_similarities import get_topic_similarity, get_all_topics
-from app.demographic_matching import calculate_demographic_similarity
+from typing import List, Dict, Any, Optional, Set, Tuple
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import func, or_, select, table, column, text, any_, bindparam, cast, inspect, BigInteger, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from app.models import Creator, Advertiser
+from app.demographic_matching import calculate_demographic_similarity, calculate_demographic_similarities
 import logging
+from operator import itemgetter
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# (creator_id, advertiser_id) -> clicks/conversions rollup; see the creator_adv_perf_mv migration
+creator_adv_perf_mv = table(
+    'creator_adv_perf_mv',
+    column('creator_id'),
+    column('advertiser_id'),
+    column('category'),
+    column('clicks'),
+    column('conversions')
+)
+
+
+def refresh_creator_performance_rollup(db: Session) -> None:
+    """Rebuild creator_adv_perf_mv inside the caller's transaction, without blocking readers.
+    
+    This is a full refresh: Postgres recomputes the whole click/conversion rollup and diffs it
+    into the view, so its cost grows with total history rather than with the upload. It takes
+    an EXCLUSIVE lock on the view until the caller commits, so concurrent uploads serialize
+    here while smart-matching reads carry on. Every writer deletes or replaces rows
+    (performance uploads replace the insertion's clicks, conversion uploads replace
+    overlapping periods), so an append-only rollup could not stay correct.
+    """
+    db.execute(text('REFRESH MATERIALIZED VIEW CONCURRENTLY creator_adv_perf_mv'))
+
+
+def parse_acct_ids(acct_ids: Optional[str]) -> Set[str]:
+    """Parse a comma-separated Acct ID list into a set of stripped, non-empty IDs."""
+    if not acct_ids:
+        return set()
+    return {acct_id.strip() for acct_id in acct_ids.split(',') if acct_id.strip()}
+
 
 class SmartMatchingService:
     """Service for smart creator matching and selection."""
@@ -46,76 +74,39 @@ class SmartMatchingService:
         """
         logger.info(f"Starting smart matching for advertiser_id={advertiser_id}, category={category}")
         
+        # Parse include (additive) and exclude (restrictive) Acct IDs; applied in SQL below
+        include_acct_ids_set = parse_acct_ids(include_acct_ids)
+        exclude_acct_ids_set = parse_acct_ids(exclude_acct_ids)
+        if include_acct_ids_set:
+            logger.info(f"Include Acct IDs (additive): {include_acct_ids_set}")
+        if exclude_acct_ids_set:
+            logger.info(f"Exclude Acct IDs: {exclude_acct_ids_set}")
+        
         # Get base creators query - INCREASE limit to get more creators for budget
-        creators_query = self._get_base_creators_query(advertiser_id, category)
-        all_creators = creators_query.distinct().limit(500).all()  # Increase to 500 creators for better budget utilization
-        print(f"DEBUG: Found {len(all_creators)} total creators (limited to 500 for budget utilization)")
+        creators_query = self._get_base_creators_query(
+            advertiser_id, category, include_acct_ids_set, exclude_acct_ids_set
+        )
+        # Single-table query, so no DISTINCT is needed; ordering by PK keeps the 500 stable across calls
+        all_creators = creators_query.order_by(Creator.creator_id).limit(500).all()  # Increase to 500 creators for better budget utilization
+        logger.debug("Found %d total creators (limited to 500 for budget utilization)", len(all_creators))
         
         if len(all_creators) == 0:
-            print("DEBUG: No creators found in database!")
+            logger.debug("No creators found in database!")
             return []
         
-        # Apply creator filtering based on Acct IDs
-        if include_acct_ids or exclude_acct_ids:
-            logger.info("Applying creator filtering")
-            
-            # Parse include Acct IDs (additive - ensure these creators are included)
-            include_acct_ids_set = set()
-            if include_acct_ids:
-                include_acct_ids_set = {acct_id.strip() for acct_id in include_acct_ids.split(',') if acct_id.strip()}
-                logger.info(f"Include Acct IDs (additive): {include_acct_ids_set}")
-            
-            # Parse exclude Acct IDs (restrictive - exclude these creators)
-            exclude_acct_ids_set = set()
-            if exclude_acct_ids:
-                exclude_acct_ids_set = {acct_id.strip() for acct_id in exclude_acct_ids.split(',') if acct_id.strip()}
-                logger.info(f"Exclude Acct IDs: {exclude_acct_ids_set}")
-            
-            # First, filter out excluded creators
-            filtered_creators = []
-            for creator in all_creators:
-                creator_acct_id = creator.acct_id.strip()
-                
-                # If exclude list is specified, exclude creators in that list
-                if exclude_acct_ids_set and creator_acct_id in exclude_acct_ids_set:
-                    logger.debug(f"Excluding creator {creator.name} (Acct ID: {creator_acct_id}) - in exclude list")
-                    continue
-                
-                filtered_creators.append(creator)
-                logger.debug(f"Including creator {creator.name} (Acct ID: {creator_acct_id})")
-            
-            # If include list is specified, ensure those creators are added even if not in filtered list
-            if include_acct_ids_set:
-                logger.info("Adding required creators from include list")
-                for creator in all_creators:
-                    creator_acct_id = creator.acct_id.strip()
-                    if creator_acct_id in include_acct_ids_set:
-                        # Check if already in filtered list
-                        if not any(c.creator_id == creator.creator_id for c in filtered_creators):
-                            filtered_creators.append(creator)
-                            logger.info(f"Added required creator {creator.name} (Acct ID: {creator_acct_id})")
-            
-            all_creators = filtered_creators
-            logger.info(f"After filtering: {len(all_creators)} creators remaining")
-        
         # Get advertiser target demographics if not provided
         if not target_demographics and advertiser_id:
             target_demographics = self._get_advertiser_demographics(advertiser_id)
         
         # Three-phase allocation: Phase 1 (CPA), Phase 2 (Cross-CVR), Phase 3 (Smart Matching)
-        three_phase_creators = self._get_three_phase_creators(
+        three_phase_creators, phase_counts = self._get_three_phase_creators(
             all_creators, advertiser_id, category, cpc, target_cpa, 
             horizon_days, advertiser_avg_cvr
         )
         
-        # Separate by phase for logging
-        phase1_creators = [c for c in three_phase_creators if c['phase'] == 1]
-        phase2_creators = [c for c in three_phase_creators if c['phase'] == 2]
-        phase3_creators = [c for c in three_phase_creators if c['phase'] == 3]
-        
-        print(f"DEBUG: Phase 1 (Same advertiser/category): {len(phase1_creators)} creators")
-        print(f"DEBUG: Phase 2 (Cross-performance): {len(phase2_creators)} creators")
-        print(f"DEBUG: Phase 3 (Smart matching): {len(phase3_creators)} creators")
+        logger.debug("Phase 1 (Same advertiser/category): %d creators", phase_counts[1])
+        logger.debug("Phase 2 (Cross-performance): %d creators", phase_counts[2])
+        logger.debug("Phase 3 (Smart matching): %d creators", phase_counts[3])
         
         # Calculate final scores and rationale for three-phase creators
         final_creators = self._calculate_final_scores(
@@ -123,15 +114,38 @@ class SmartMatchingService:
         )
         
         # Sort by tier first, then by combined score within each tier
-        final_creators.sort(key=lambda x: (x['tier'], -x['combined_score']))
+        final_creators.sort(key=itemgetter('_final_key'))
         
-        print(f"DEBUG: Final selection: {len(final_creators)} creators")
+        logger.debug("Final selection: %d creators", len(final_creators))
         return final_creators
     
-    def _get_base_creators_query(self, advertiser_id: Optional[int], category: Optional[str]):
+    def _get_base_creators_query(
+        self,
+        advertiser_id: Optional[int],
+        category: Optional[str],
+        include_acct_ids: Optional[Set[str]] = None,
+        exclude_acct_ids: Optional[Set[str]] = None
+    ):
         """Get base creators query - return ALL creators, don't filter by historical data."""
-        # Always return all creators, let the tiers handle filtering
-        query = self.db.query(Creator)
+        # Always return all creators, let the tiers handle filtering.
+        # Only the columns read by matching, scoring and the planner are loaded.
+        query = self.db.query(Creator).options(load_only(
+            Creator.creator_id,
+            Creator.acct_id,
+            Creator.name,
+            Creator.age_range,
+            Creator.gender_skew,
+            Creator.location,
+            Creator.interests,
+            Creator.conservative_click_estimate
+        ))
+        
+        # Excluded Acct IDs are dropped unless also listed in the include list
+        if exclude_acct_ids:
+            keep = Creator.acct_id.notin_(exclude_acct_ids)
+            if include_acct_ids:
+                keep = or_(keep, Creator.acct_id.in_(include_acct_ids))
+            query = query.filter(keep)
         
         # Only apply basic filters, don't join on performance data
         # This ensures we get the full creator pool (800 creators)
@@ -140,17 +154,17 @@ class SmartMatchingService:
         return query
     
     def _get_advertiser_demographics(self, advertiser_id: int) -> Dict[str, Any]:
-        """Get advertiser target demographics."""
-        advertiser = self.db.query(Advertiser).filter(Advertiser.advertiser_id == advertiser_id).first()
-        if not advertiser:
+        """Get advertiser target demographics as a plain dict, read once per request."""
+        row = self.db.query(
+            Advertiser.target_age_range,
+            Advertiser.target_gender_skew,
+            Advertiser.target_location,
+            Advertiser.target_interests
+        ).filter(Advertiser.advertiser_id == advertiser_id).first()
+        if not row:
             return {}
         
-        return {
-            'target_age_range': advertiser.target_age_range,
-            'target_gender_skew': advertiser.target_gender_skew,
-            'target_location': advertiser.target_location,
-            'target_interests': advertiser.target_interests
-        }
+        return dict(row._mapping)
     
     def _get_three_phase_creators(
         self, 
@@ -161,31 +175,38 @@ class SmartMatchingService:
         target_cpa: Optional[float],
         horizon_days: int,
         advertiser_avg_cvr: float
-    ) -> List[Dict[str, Any]]:
-        """Three-phase allocation: Phase 1 (CPA), Phase 2 (Cross-CVR), Phase 3 (Smart Matching)."""
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, int]]:
+        """
+        Three-phase allocation: Phase 1 (CPA), Phase 2 (Cross-CVR), Phase 3 (Smart Matching).
+        
+        Returns:
+            The allocated creators and the number of creators kept in each phase
+        """
         all_creators = []
+        phase_counts = {1: 0, 2: 0, 3: 0}
         
         # Batch performance data query for all creators
         creator_ids = [creator.creator_id for creator in creators]
         batch_performance_data = self._get_batch_performance_data(creator_ids, advertiser_id, category)
         
-        for creator in creators:
-            # Get performance data from batch results
-            perf_data = batch_performance_data.get(creator.creator_id, {
-                'phase': 3,
-                'total_clicks': 0,
-                'total_conversions': 0,
-                'historical_cvr': 0.0,
-                'cross_clicks': 0,
-                'cross_conversions': 0,
-                'cross_cvr': 0.0
-            })
-            
-            # Create performance data in the expected format
-            performance_data = self._create_performance_data_from_batch(
-                creator, perf_data, cpc, horizon_days, advertiser_avg_cvr
-            )
-            
+        # Create performance data in the expected format for all creators at once
+        no_performance = {
+            'phase': 3,
+            'total_clicks': 0,
+            'total_conversions': 0,
+            'historical_cvr': 0.0,
+            'cross_clicks': 0,
+            'cross_conversions': 0,
+            'cross_cvr': 0.0
+        }
+        all_performance_data = self._create_performance_data_batch(
+            creators,
+            [batch_performance_data.get(creator.creator_id, no_performance) for creator in creators],
+            cpc,
+            advertiser_avg_cvr
+        )
+        
+        for creator, performance_data in zip(creators, all_performance_data):
             # Determine tier and rationale based on phase
             if performance_data['phase'] == 1:
                 tier = 1
@@ -220,14 +241,13 @@ class SmartMatchingService:
             if performance_data['phase'] == 1:
                 if target_cpa is None or performance_data['expected_cpa'] <= target_cpa:
                     all_creators.append(creator_data)
+                    phase_counts[1] += 1
             else:
                 # Phase 2 and 3 don't have CPA constraints
                 all_creators.append(creator_data)
+                phase_counts[performance_data['phase']] += 1
         
-        # Sort by tier first, then by sort_key within each tier
-        all_creators.sort(key=lambda x: (x['tier'], x['sort_key']))
-        
-        return all_creators
+        return all_creators, phase_counts
     
     def _get_tier2_creators(
         self, 
@@ -378,58 +398,73 @@ class SmartMatchingService:
         batch_performance_data: Optional[Dict[int, Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """Calculate final combined scores for all creators."""
-        for creator_data in creators:
-            creator = creator_data['creator']
-            
-            # Use batch performance data if available, otherwise use individual data
-            if batch_performance_data and creator.creator_id in batch_performance_data:
-                batch_data = batch_performance_data[creator.creator_id]
-                # Update performance_data with batch data
-                creator_data['performance_data'] = self._create_performance_data_from_batch(
-                    creator, batch_data, cpc, horizon_days, 0.025
-                )
-                print(f"DEBUG: Using batch performance data for creator {creator.creator_id}")
-            
-            # Calculate performance score
+        if not creators:
+            return creators
+        
+        creator_objs = [creator_data['creator'] for creator_data in creators]
+        
+        # Use batch performance data if available, otherwise keep the individual data
+        if batch_performance_data:
+            refreshed = [
+                creator_data for creator_data in creators
+                if creator_data['creator'].creator_id in batch_performance_data
+            ]
+            refreshed_performance_data = self._create_performance_data_batch(
+                [creator_data['creator'] for creator_data in refreshed],
+                [batch_performance_data[creator_data['creator'].creator_id] for creator_data in refreshed],
+                cpc,
+                0.025
+            )
+            for creator_data, performance_data in zip(refreshed, refreshed_performance_data):
+                creator_data['performance_data'] = performance_data
+            logger.debug("Using batch performance data for %d creators", len(refreshed))
+        
+        performance_scores = np.zeros(len(creators))
+        for i, creator_data in enumerate(creators):
             performance_data = creator_data['performance_data']
             if performance_data and performance_data.get('has_performance', False):
-                performance_score = 1.0
-            else:
-                performance_score = 0.0
-            
-            # Calculate demographic score if target demographics provided
-            demographic_score = 0.0
-            if target_demographics:
-                creator_demographics = {
-                    'age_range': creator.age_range,
-                    'gender_skew': creator.gender_skew,
-                    'location': creator.location,
-                    'interests': creator.interests
-                }
-                demographic_score = calculate_demographic_similarity(
-                    creator_demographics, target_demographics
-                )
-            
-            # Calculate topic score
-            topic_score = creator_data.get('topic_score', 0.0)
-            
-            # Calculate similarity score
-            similarity_score = creator_data.get('similarity_score', 0.0)
-            
-            # Combined score with weights
-            combined_score = (
-                performance_score * 0.5 +      # 50% weight to performance
-                demographic_score * 0.2 +       # 20% weight to demographics
-                topic_score * 0.2 +            # 20% weight to topics
-                similarity_score * 0.1         # 10% weight to similarity
+                performance_scores[i] = 1.0
+        
+        topic_scores = np.array([creator_data.get('topic_score', 0.0) for creator_data in creators], dtype=float)
+        similarity_scores = np.array([creator_data.get('similarity_score', 0.0) for creator_data in creators], dtype=float)
+        
+        # Calculate demographic scores if target demographics provided; an advertiser
+        # with no targets set scores 0.0 for every creator, so skip the work
+        if target_demographics and any(target_demographics.values()):
+            demographic_scores = calculate_demographic_similarities(
+                [c.age_range for c in creator_objs],
+                [c.gender_skew for c in creator_objs],
+                [c.location for c in creator_objs],
+                [c.interests for c in creator_objs],
+                target_demographics
             )
-            
+        else:
+            demographic_scores = np.zeros(len(creators))
+        
+        # Combined score with weights: 50% performance, 20% demographics, 20% topics, 10% similarity
+        combined_scores = (
+            performance_scores * 0.5 +
+            demographic_scores * 0.2 +
+            topic_scores * 0.2 +
+            similarity_scores * 0.1
+        )
+        
+        for creator_data, performance_score, demographic_score, topic_score, similarity_score, combined_score in zip(
+            creators,
+            performance_scores.tolist(),
+            demographic_scores.tolist(),
+            topic_scores.tolist(),
+            similarity_scores.tolist(),
+            combined_scores.tolist()
+        ):
             creator_data.update({
                 'performance_score': performance_score,
                 'demographic_score': demographic_score,
                 'topic_score': topic_score,
                 'similarity_score': similarity_score,
-                'combined_score': combined_score
+                'combined_score': combined_score,
+                # Ties on combined score fall back to the phase's own ordering (CPA, CVR, ...)
+                '_final_key': (creator_data['tier'], -combined_score, creator_data['sort_key'])
             })
         
         return creators
@@ -441,16 +476,50 @@ class SmartMatchingService:
         category: Optional[str]
     ) -> Dict[int, Dict[str, Any]]:
         """Get performance data for multiple creators in batch queries with three-phase categorization."""
-        from sqlalchemy import func, and_
-        from app.models import ClickUnique, PerfUpload, Insertion, Campaign, Advertiser, Conversion
+        logger.debug("Getting batch performance data for %d creators", len(creator_ids))
         
-        print(f"DEBUG: Getting batch performance data for {len(creator_ids)} creators")
-        
-        # Phase 1: Same advertiser/category performance
-        same_performance_data = self._get_same_performance_data(creator_ids, advertiser_id, category)
+        # Same vs. cross split: by category if given, else by advertiser.
+        # With neither, all history counts as both same and cross.
+        if category:
+            same_filter = creator_adv_perf_mv.c.category == category
+            cross_filter = creator_adv_perf_mv.c.category != category
+        elif advertiser_id:
+            same_filter = creator_adv_perf_mv.c.advertiser_id == advertiser_id
+            cross_filter = creator_adv_perf_mv.c.advertiser_id != advertiser_id
+        else:
+            same_filter = cross_filter = None
+        
+        def phase_sum(column, phase_filter):
+            total = func.sum(column)
+            if phase_filter is not None:
+                total = total.filter(phase_filter)
+            # SUM(bigint) is numeric in Postgres; cast back so rows carry ints, not Decimals
+            return cast(total, BigInteger)
+        
+        # Phase 1 and Phase 2 clicks and conversions from the precomputed rollup
+        rows = self.db.execute(
+            select(
+                creator_adv_perf_mv.c.creator_id,
+                phase_sum(creator_adv_perf_mv.c.clicks, same_filter).label('same_clicks'),
+                phase_sum(creator_adv_perf_mv.c.conversions, same_filter).label('same_conversions'),
+                phase_sum(creator_adv_perf_mv.c.clicks, cross_filter).label('cross_clicks'),
+                phase_sum(creator_adv_perf_mv.c.conversions, cross_filter).label('cross_conversions')
+            ).where(
+                creator_adv_perf_mv.c.creator_id == any_(bindparam('creator_ids', creator_ids, type_=ARRAY(Integer)))
+            ).group_by(creator_adv_perf_mv.c.creator_id)
+        ).all()
         
-        # Phase 2: Cross-performance (other advertisers/categories)
-        cross_performance_data = self._get_cross_performance_data(creator_ids, advertiser_id, category)
+        same_performance_data = {}
+        cross_performance_data = {}
+        for row in rows:
+            same_performance_data[row.creator_id] = {
+                'total_clicks': row.same_clicks or 0,
+                'total_conversions': row.same_conversions or 0
+            }
+            cross_performance_data[row.creator_id] = {
+                'total_clicks': row.cross_clicks or 0,
+                'total_conversions': row.cross_conversions or 0
+            }
         
         # Combine results with phase categorization
         performance_data = {}
@@ -495,432 +564,110 @@ class SmartMatchingService:
         
         return performance_data
 
-    def _get_same_performance_data(
-        self, 
-        creator_ids: List[int],
-        advertiser_id: Optional[int], 
-        category: Optional[str]
-    ) -> Dict[int, Dict[str, Any]]:
-        """Get performance data for same advertiser/category."""
-        from sqlalchemy import func
-        from app.models import ClickUnique, PerfUpload, Insertion, Campaign, Advertiser, Conversion
-        
-        # Build base query for clicks (same advertiser/category)
-        clicks_query = self.db.query(
-            ClickUnique.creator_id,
-            func.sum(ClickUnique.unique_clicks).label('total_clicks')
-        ).join(
-            PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-        ).join(
-            Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).filter(ClickUnique.creator_id.in_(creator_ids))
-        
-        # Add category or advertiser filter
-        if category:
-            clicks_query = clicks_query.join(
-                Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-            ).filter(Advertiser.category == category)
-        elif advertiser_id:
-            clicks_query = clicks_query.filter(Campaign.advertiser_id == advertiser_id)
-        
-        clicks_results = {row.creator_id: row.total_clicks or 0 for row in clicks_query.group_by(ClickUnique.creator_id).all()}
-        
-        # Build base query for conversions (same advertiser/category)
-        conversions_query = self.db.query(
-            Conversion.creator_id,
-            func.sum(Conversion.conversions).label('total_conversions')
-        ).join(
-            Insertion, Insertion.insertion_id == Conversion.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).filter(Conversion.creator_id.in_(creator_ids))
-        
-        # Add category or advertiser filter
-        if category:
-            conversions_query = conversions_query.join(
-                Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-            ).filter(Advertiser.category == category)
-        elif advertiser_id:
-            conversions_query = conversions_query.filter(Campaign.advertiser_id == advertiser_id)
-        
-        conversions_results = {row.creator_id: row.total_conversions or 0 for row in conversions_query.group_by(Conversion.creator_id).all()}
-        
-        # Combine results
-        same_performance_data = {}
-        for creator_id in creator_ids:
-            same_performance_data[creator_id] = {
-                'total_clicks': clicks_results.get(creator_id, 0),
-                'total_conversions': conversions_results.get(creator_id, 0)
-            }
-        
-        return same_performance_data
-
-    def _get_cross_performance_data(
-        self, 
-        creator_ids: List[int],
-        advertiser_id: Optional[int], 
-        category: Optional[str]
-    ) -> Dict[int, Dict[str, Any]]:
-        """Get performance data for other advertisers/categories."""
-        from sqlalchemy import func
-        from app.models import ClickUnique, PerfUpload, Insertion, Campaign, Advertiser, Conversion
-        
-        # Build base query for clicks (other advertisers/categories)
-        clicks_query = self.db.query(
-            ClickUnique.creator_id,
-            func.sum(ClickUnique.unique_clicks).label('total_clicks')
-        ).join(
-            PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-        ).join(
-            Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).join(
-            Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-        ).filter(ClickUnique.creator_id.in_(creator_ids))
-        
-        # Exclude same advertiser/category
-        if category:
-            clicks_query = clicks_query.filter(Advertiser.category != category)
-        elif advertiser_id:
-            clicks_query = clicks_query.filter(Campaign.advertiser_id != advertiser_id)
-        
-        clicks_results = {row.creator_id: row.total_clicks or 0 for row in clicks_query.group_by(ClickUnique.creator_id).all()}
-        
-        # Build base query for conversions (other advertisers/categories)
-        conversions_query = self.db.query(
-            Conversion.creator_id,
-            func.sum(Conversion.conversions).label('total_conversions')
-        ).join(
-            Insertion, Insertion.insertion_id == Conversion.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).join(
-            Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-        ).filter(Conversion.creator_id.in_(creator_ids))
-        
-        # Exclude same advertiser/category
-        if category:
-            conversions_query = conversions_query.filter(Advertiser.category != category)
-        elif advertiser_id:
-            conversions_query = conversions_query.filter(Campaign.advertiser_id != advertiser_id)
-        
-        conversions_results = {row.creator_id: row.total_conversions or 0 for row in conversions_query.group_by(Conversion.creator_id).all()}
-        
-        # Combine results
-        cross_performance_data = {}
-        for creator_id in creator_ids:
-            cross_performance_data[creator_id] = {
-                'total_clicks': clicks_results.get(creator_id, 0),
-                'total_conversions': conversions_results.get(creator_id, 0)
-            }
-        
-        return cross_performance_data
-
-    def _create_performance_data_from_batch(
+    def _create_performance_data_batch(
         self,
-        creator: Creator,
-        perf_data: Dict[str, Any],
+        creators: List[Creator],
+        perf_datas: List[Dict[str, Any]],
         cpc: float,
-        horizon_days: int,
         advertiser_avg_cvr: float
-    ) -> Dict[str, Any]:
-        """Create performance data from batch query results with three-phase logic."""
-        phase = perf_data['phase']
-        total_clicks = perf_data['total_clicks']
-        total_conversions = perf_data['total_conversions']
-        historical_cvr = perf_data['historical_cvr']
-        cross_clicks = perf_data['cross_clicks']
-        cross_conversions = perf_data['cross_conversions']
-        cross_cvr = perf_data['cross_cvr']
-        
-        print(f"DEBUG: Creator {creator.creator_id} - Phase {phase}: same_clicks={total_clicks}, same_conversions={total_conversions}, cross_clicks={cross_clicks}, cross_conversions={cross_conversions}")
-        
-        # Determine CVR based on phase
-        if phase == 1:
-            # Phase 1: Use same advertiser/category CVR
-            expected_cvr = historical_cvr if historical_cvr > 0 else advertiser_avg_cvr
-            performance_clicks = total_clicks
-            performance_conversions = total_conversions
-        elif phase == 2:
-            # Phase 2: Use cross-performance CVR
-            expected_cvr = cross_cvr if cross_cvr > 0 else advertiser_avg_cvr
-            performance_clicks = cross_clicks
-            performance_conversions = cross_conversions
-        else:
-            # Phase 3: Use advertiser average CVR
-            expected_cvr = advertiser_avg_cvr
-            performance_clicks = 0
-            performance_conversions = 0
-        
-        print(f"DEBUG: Creator {creator.creator_id} - Phase {phase}, Using CVR: {expected_cvr:.4f}")
-        
-        # Calculate expected clicks based on phase
-        if phase == 1 and total_clicks > 0:
-            # Use same advertiser performance
-            expected_clicks = total_clicks / max(1, total_clicks / 100)  # Rough estimate
-        elif phase == 2 and cross_clicks > 0:
-            # Use cross-performance data
-            expected_clicks = cross_clicks / max(1, cross_clicks / 100)  # Rough estimate
-        else:
-            # Fallback to conservative estimate
-            expected_clicks = creator.conservative_click_estimate or 100
-            print(f"DEBUG: Creator {creator.creator_id} - Using conservative estimate: {expected_clicks}")
-        
-        # Calculate other metrics
-        expected_spend = cpc * expected_clicks
-        expected_conversions = expected_clicks * expected_cvr
-        expected_cpa = cpc / expected_cvr if expected_cvr > 0 else None
-        
-        cpa_str = f"${expected_cpa:.2f}" if expected_cpa else "N/A"
-        print(f"DEBUG: Creator {creator.creator_id} - Expected clicks: {expected_clicks}, spend: ${expected_spend:.2f}, conversions: {expected_conversions:.2f}, CPA: {cpa_str}")
-        
-        return {
-            'phase': phase,
-            'has_performance': performance_clicks > 0 or performance_conversions > 0,
-            'expected_cpa': expected_cpa,
-            'expected_clicks': expected_clicks,
-            'expected_spend': expected_spend,
-            'expected_conversions': expected_conversions,
-            'expected_cvr': expected_cvr,
-            'historical_clicks': performance_clicks,
-            'historical_conversions': performance_conversions,
-            'median_clicks_per_placement': expected_clicks,
-            'recommended_placements': 1
-        }
-
-    def _get_creator_performance(
-        self, 
-        creator: Creator, 
-        advertiser_id: Optional[int], 
-        category: Optional[str],
-        cpc: float,
-        horizon_days: int,
-        advertiser_avg_cvr: float
-    ) -> Dict[str, Any]:
-        """Get creator performance data based on historical data."""
-        from sqlalchemy import func, and_
-        from app.models import ClickUnique, PerfUpload, Insertion, Campaign, Advertiser, Conversion
-        
-        print(f"DEBUG: Getting performance data for creator {creator.creator_id} ({creator.name})")
-        
-        # Build base query for clicks
-        clicks_query = self.db.query(func.sum(ClickUnique.unique_clicks)).join(
-            PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-        ).join(
-            Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).filter(ClickUnique.creator_id == creator.creator_id)
-        
-        # Add category or advertiser filter
-        if category:
-            clicks_query = clicks_query.join(
-                Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-            ).filter(Advertiser.category == category)
-        elif advertiser_id:
-            clicks_query = clicks_query.filter(Campaign.advertiser_id == advertiser_id)
-        
-        total_clicks = clicks_query.scalar() or 0
-        print(f"DEBUG: Creator {creator.creator_id} - Total historical clicks: {total_clicks}")
-        
-        # Build base query for conversions
-        conversions_query = self.db.query(func.sum(Conversion.conversions)).join(
-            Insertion, Insertion.insertion_id == Conversion.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).filter(Conversion.creator_id == creator.creator_id)
+    ) -> List[Dict[str, Any]]:
+        """Create performance data from batch query results with three-phase logic, for all creators at once."""
+        if not creators:
+            return []
         
-        # Add category or advertiser filter
-        if category:
-            conversions_query = conversions_query.join(
-                Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-            ).filter(Advertiser.category == category)
-        elif advertiser_id:
-            conversions_query = conversions_query.filter(Campaign.advertiser_id == advertiser_id)
-        
-        total_conversions = conversions_query.scalar() or 0
-        print(f"DEBUG: Creator {creator.creator_id} - Total historical conversions: {total_conversions}")
-        
-        # Calculate historical CVR
-        historical_cvr = 0.0
-        if total_clicks > 0:
-            historical_cvr = total_conversions / total_clicks
-            print(f"DEBUG: Creator {creator.creator_id} - Historical CVR: {historical_cvr:.4f}")
-        
-        # Use historical CVR if available, otherwise use advertiser average
-        expected_cvr = historical_cvr if historical_cvr > 0 else advertiser_avg_cvr
-        print(f"DEBUG: Creator {creator.creator_id} - Using CVR: {expected_cvr:.4f}")
-        
-        # Calculate expected clicks based on historical performance
-        if total_clicks > 0:
-            # Get individual placement click data to calculate median clicks per placement
-            placement_clicks_query = self.db.query(ClickUnique.unique_clicks).join(
-                PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-            ).join(
-                Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-            ).join(
-                Campaign, Campaign.campaign_id == Insertion.campaign_id
-            ).filter(ClickUnique.creator_id == creator.creator_id)
-            
-            # Add category or advertiser filter
-            if category:
-                placement_clicks_query = placement_clicks_query.join(
-                    Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-                ).filter(Advertiser.category == category)
-            elif advertiser_id:
-                placement_clicks_query = placement_clicks_query.filter(Campaign.advertiser_id == advertiser_id)
-            
-            placement_clicks = [row[0] for row in placement_clicks_query.all() if row[0] is not None]
-            
-            if placement_clicks:
-                # Calculate median clicks per placement
-                placement_clicks.sort()
-                median_clicks = placement_clicks[len(placement_clicks) // 2]
-                print(f"DEBUG: Creator {creator.creator_id} - Median clicks per placement: {median_clicks}")
-                
-                # Use median clicks per placement (keep original logic)
-                expected_clicks = median_clicks
-                print(f"DEBUG: Creator {creator.creator_id} - Using median clicks for 1 placement: {expected_clicks}")
-            else:
-                # Try to get clicks from other campaigns first
-                other_campaigns_clicks = self._get_other_campaigns_clicks(creator, advertiser_id, category)
-                if other_campaigns_clicks > 0:
-                    expected_clicks = other_campaigns_clicks
-                    print(f"DEBUG: Creator {creator.creator_id} - Using other campaigns clicks: {expected_clicks}")
-                else:
-                    # Final fallback to conservative estimate
-                    expected_clicks = creator.conservative_click_estimate or 100
-                    print(f"DEBUG: Creator {creator.creator_id} - No campaign data, using conservative estimate: {expected_clicks}")
-        else:
-            # Fallback to conservative estimate
-            expected_clicks = creator.conservative_click_estimate or 100
-            print(f"DEBUG: Creator {creator.creator_id} - Using conservative estimate: {expected_clicks}")
+        def field(name: str) -> np.ndarray:
+            return np.array([perf_data[name] for perf_data in perf_datas], dtype=float)
+        
+        phase = np.array([perf_data['phase'] for perf_data in perf_datas])
+        total_clicks = field('total_clicks')
+        total_conversions = field('total_conversions')
+        historical_cvr = field('historical_cvr')
+        cross_clicks = field('cross_clicks')
+        cross_conversions = field('cross_conversions')
+        cross_cvr = field('cross_cvr')
+        conservative_clicks = self._get_conservative_click_estimates(creators)
+        
+        is_phase1 = phase == 1
+        is_phase2 = phase == 2
+        
+        # Determine CVR based on phase: same advertiser/category, cross-performance, else advertiser average
+        expected_cvr = np.select(
+            [is_phase1, is_phase2],
+            [
+                np.where(historical_cvr > 0, historical_cvr, advertiser_avg_cvr),
+                np.where(cross_cvr > 0, cross_cvr, advertiser_avg_cvr)
+            ],
+            default=advertiser_avg_cvr
+        )
+        performance_clicks = np.select([is_phase1, is_phase2], [total_clicks, cross_clicks], default=0.0)
+        performance_conversions = np.select([is_phase1, is_phase2], [total_conversions, cross_conversions], default=0.0)
+        
+        # Calculate expected clicks based on phase; rough estimate from history, else conservative estimate
+        has_click_history = (is_phase1 & (total_clicks > 0)) | (is_phase2 & (cross_clicks > 0))
+        expected_clicks = np.where(
+            has_click_history,
+            performance_clicks / np.maximum(1, performance_clicks / 100),
+            conservative_clicks
+        )
         
         # Calculate other metrics
         expected_spend = cpc * expected_clicks
         expected_conversions = expected_clicks * expected_cvr
-        expected_cpa = cpc / expected_cvr if expected_cvr > 0 else None
-        
-        print(f"DEBUG: Creator {creator.creator_id} - Expected clicks: {expected_clicks}, spend: ${expected_spend:.2f}, conversions: {expected_conversions:.2f}")
-        
-        return {
-            'has_performance': total_clicks > 0 or total_conversions > 0,
-            'expected_cpa': expected_cpa,
-            'expected_clicks': expected_clicks,
-            'expected_spend': expected_spend,
-            'expected_conversions': expected_conversions,
-            'expected_cvr': expected_cvr,
-            'historical_clicks': total_clicks,
-            'historical_conversions': total_conversions,
-            'median_clicks_per_placement': median_clicks if 'median_clicks' in locals() else None,
-            'recommended_placements': 1  # Start with 1 placement, can be increased if under budget
-        }
-    
-    def _calculate_topic_match(self, creator: Creator, target_topics: set) -> float:
-        """Calculate topic match score for creator."""
-        creator_topics = self.db.query(Topic).join(CreatorTopic).filter(
-            CreatorTopic.creator_id == creator.creator_id
-        ).all()
-        
-        if not creator_topics or not target_topics:
-            return 0.0
-        
-        max_similarity = 0.0
-        for creator_topic in creator_topics:
-            for target_topic in target_topics:
-                similarity = get_topic_similarity(creator_topic.name, target_topic)
-                max_similarity = max(max_similarity, similarity)
-        
-        return max_similarity
-    
-    def _calculate_keyword_match(self, creator: Creator, target_keywords: set) -> float:
-        """Calculate keyword match score for creator."""
-        creator_keywords = self.db.query(Keyword).join(CreatorKeyword).filter(
-            CreatorKeyword.creator_id == creator.creator_id
-        ).all()
-        
-        if not creator_keywords or not target_keywords:
-            return 0.0
-        
-        creator_keyword_set = set()
-        for keyword in creator_keywords:
-            creator_keyword_set.update(keyword.keywords.split(','))
-        
-        if not creator_keyword_set:
-            return 0.0
-        
-        intersection = creator_keyword_set.intersection(target_keywords)
-        union = creator_keyword_set.union(target_keywords)
+        has_performance = (performance_clicks > 0) | (performance_conversions > 0)
+        
+        results = []
+        for i, (creator, cvr, clicks, spend, conversions) in enumerate(zip(
+            creators,
+            expected_cvr.tolist(),
+            expected_clicks.tolist(),
+            expected_spend.tolist(),
+            expected_conversions.tolist()
+        )):
+            expected_cpa = cpc / cvr if cvr > 0 else None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Creator %s - Phase %s, CVR: %.4f, expected clicks: %s, spend: $%.2f, conversions: %.2f, CPA: %s",
+                    creator.creator_id, phase[i], cvr, clicks, spend, conversions,
+                    f"${expected_cpa:.2f}" if expected_cpa else "N/A"
+                )
+            results.append({
+                'phase': perf_datas[i]['phase'],
+                'has_performance': bool(has_performance[i]),
+                'expected_cpa': expected_cpa,
+                'expected_clicks': clicks,
+                'expected_spend': spend,
+                'expected_conversions': conversions,
+                'expected_cvr': cvr,
+                'historical_clicks': perf_datas[i]['total_clicks'] if is_phase1[i] else perf_datas[i]['cross_clicks'] if is_phase2[i] else 0,
+                'historical_conversions': perf_datas[i]['total_conversions'] if is_phase1[i] else perf_datas[i]['cross_conversions'] if is_phase2[i] else 0,
+                'median_clicks_per_placement': clicks,
+                'recommended_placements': 1
+            })
         
-        return len(intersection) / len(union) if union else 0.0
-    
-    def _get_creator_similarity(self, creator_a_id: int, creator_b_id: int) -> float:
-        """Get pre-computed similarity between two creators."""
-        similarity = self.db.query(CreatorSimilarity).filter(
-            and_(
-                CreatorSimilarity.creator_a_id == creator_a_id,
-                CreatorSimilarity.creator_b_id == creator_b_id,
-                CreatorSimilarity.similarity_type == 'combined'
-            )
-        ).first()
+        return results
+
+    def _get_conservative_click_estimates(self, creators: List[Creator]) -> np.ndarray:
+        """Conservative click estimate per creator as an array, defaulting to 100 when unset or 0.
         
-        return similarity.similarity_score if similarity else 0.0
-    
-    def _get_other_campaigns_clicks(self, creator: Creator, advertiser_id: Optional[int], category: Optional[str]) -> int:
-        """Get click estimates from other campaigns for this creator."""
-        from sqlalchemy import func, and_
-        from app.models import ClickUnique, PerfUpload, Insertion, Campaign, Advertiser
-        
-        print(f"DEBUG: Getting other campaigns clicks for creator {creator.creator_id}")
-        
-        # Build query for clicks from OTHER campaigns
-        other_campaigns_query = self.db.query(func.sum(ClickUnique.unique_clicks)).join(
-            PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-        ).join(
-            Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-        ).join(
-            Campaign, Campaign.campaign_id == Insertion.campaign_id
-        ).filter(ClickUnique.creator_id == creator.creator_id)
-        
-        # Exclude the current advertiser/category
-        if advertiser_id:
-            other_campaigns_query = other_campaigns_query.filter(Campaign.advertiser_id != advertiser_id)
-        elif category:
-            other_campaigns_query = other_campaigns_query.join(
-                Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-            ).filter(Advertiser.category != category)
-        
-        total_other_clicks = other_campaigns_query.scalar() or 0
-        print(f"DEBUG: Creator {creator.creator_id} - Total other campaigns clicks: {total_other_clicks}")
-        
-        if total_other_clicks > 0:
-            # Get individual placement clicks from other campaigns to calculate median
-            placement_clicks_query = self.db.query(ClickUnique.unique_clicks).join(
-                PerfUpload, PerfUpload.perf_upload_id == ClickUnique.perf_upload_id
-            ).join(
-                Insertion, Insertion.insertion_id == PerfUpload.insertion_id
-            ).join(
-                Campaign, Campaign.campaign_id == Insertion.campaign_id
-            ).filter(ClickUnique.creator_id == creator.creator_id)
-            
-            # Exclude current advertiser/category
-            if advertiser_id:
-                placement_clicks_query = placement_clicks_query.filter(Campaign.advertiser_id != advertiser_id)
-            elif category:
-                placement_clicks_query = placement_clicks_query.join(
-                    Advertiser, Advertiser.advertiser_id == Campaign.advertiser_id
-                ).filter(Advertiser.category != category)
-            
-            placement_clicks = [row[0] for row in placement_clicks_query.all() if row[0] is not None]
-            
-            if placement_clicks:
-                # Calculate median clicks per placement from other campaigns
-                placement_clicks.sort()
-                median_clicks = placement_clicks[len(placement_clicks) // 2]
-                print(f"DEBUG: Creator {creator.creator_id} - Median clicks from other campaigns: {median_clicks}")
-                return median_clicks
-        
-        return 0
+        Values already loaded on the instances are used as-is; creators where the column is
+        deferred or expired are fetched together in one query instead of one lazy load each.
+        """
+        unloaded_ids = [
+            creator.creator_id for creator in creators
+            if (state := inspect(creator, raiseerr=False)) is not None
+            and 'conservative_click_estimate' in state.unloaded
+        ]
+        fetched: Dict[int, Optional[int]] = {}
+        if unloaded_ids:
+            fetched = dict(self.db.execute(
+                select(Creator.creator_id, Creator.conservative_click_estimate).where(
+                    Creator.creator_id == any_(bindparam('creator_ids', unloaded_ids, type_=ARRAY(Integer)))
+                )
+            ).all())
+        
+        conservative_clicks = np.array([
+            (fetched[creator.creator_id] if creator.creator_id in fetched
+             else creator.conservative_click_estimate) or 0
+            for creator in creators
+        ], dtype=float)
+        return np.where(conservative_clicks != 0, conservative_clicks, 100.0)
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
-from fastapi import Response
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.routers import core, seed, uploads, analytics, declined_creators, auth, chatbot, plans
@@ -7,6 +8,18 @@ import os
 
 app = FastAPI(title="Kit Targeting App API", version="1.0.0")
 
+
+# Reject oversized CSV uploads from the Content-Length header before the multipart body is parsed.
+# Registered before CORS so the 413 response still carries CORS headers.
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    if request.method == "POST" and request.url.path.startswith(("/api/uploads/", "/api/vectors")):
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > uploads.MAX_UPLOAD_BYTES:
+            return JSONResponse(status_code=413, content={"detail": "Upload is too large"})
+    return await call_next(request)
+
+
 # Check OpenAI API key on startup
 if not os.getenv("OPENAI_API_KEY"):
     print("WARNING: OPENAI_API_KEY not set. Chatbot functionality will not work.")
@@ -0,0 +1,38 @@
+import io
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+from app.routers.uploads import validate_csv_upload
+
+
+def make_upload(filename, content_type=None):
+    headers = Headers({"content-type": content_type}) if content_type else Headers({})
+    return UploadFile(file=io.BytesIO(b"a,b\n1,2\n"), filename=filename, headers=headers)
+
+
+class TestValidateCsvUpload:
+    """Test cases for validate_csv_upload function."""
+
+    def test_text_csv_accepted(self):
+        """Test: text/csv content type"""
+        validate_csv_upload(make_upload("data.csv", "text/csv"))
+
+    def test_excel_csv_content_type_accepted(self):
+        """Test: Windows browsers label CSVs as application/vnd.ms-excel"""
+        validate_csv_upload(make_upload("data.csv", "application/vnd.ms-excel"))
+
+    def test_generic_content_type_falls_back_to_extension(self):
+        """Test: application/octet-stream with a .csv filename"""
+        validate_csv_upload(make_upload("DATA.CSV", "application/octet-stream"))
+
+    def test_generic_content_type_without_csv_extension_rejected(self):
+        """Test: application/octet-stream with a non-CSV filename"""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_csv_upload(make_upload("data.bin", "application/octet-stream"))
+        assert exc_info.value.status_code == 400
+
+    def test_non_csv_content_type_rejected(self):
+        """Test: A .csv filename does not override a non-CSV content type"""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_csv_upload(make_upload("data.csv", "application/pdf"))
+        assert exc_info.value.status_code == 400
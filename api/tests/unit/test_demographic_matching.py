@@ -0,0 +1,38 @@
+import pytest
+from app.demographic_matching import calculate_demographic_similarity, calculate_demographic_similarities
+
+
+CREATORS = [
+    {'age_range': '25-34', 'gender_skew': 'mostly men', 'location': 'US', 'interests': 'tech, finance'},
+    {'age_range': '18-24', 'gender_skew': 'even split', 'location': 'uk', 'interests': 'Finance,travel'},
+    {'age_range': 'bad', 'gender_skew': None, 'location': '', 'interests': ' , '},
+    {'age_range': None, 'gender_skew': None, 'location': None, 'interests': None},
+    {'age_range': '25-34', 'gender_skew': 'mostly women', 'location': 'AU', 'interests': 'tech'},
+]
+
+
+def _batch(target):
+    return calculate_demographic_similarities(
+        [c['age_range'] for c in CREATORS],
+        [c['gender_skew'] for c in CREATORS],
+        [c['location'] for c in CREATORS],
+        [c['interests'] for c in CREATORS],
+        target
+    )
+
+
+class TestCalculateDemographicSimilarities:
+    """The vectorized scorer must agree with calculate_demographic_similarity."""
+
+    @pytest.mark.parametrize("target", [
+        {'target_age_range': '25-34', 'target_gender_skew': 'mostly men', 'target_location': 'US', 'target_interests': 'tech,finance'},
+        {'target_age_range': '20-29', 'target_gender_skew': 'even split', 'target_location': None, 'target_interests': 'travel'},
+        {'target_age_range': None, 'target_gender_skew': None, 'target_location': 'UK', 'target_interests': None},
+        {},
+    ])
+    def test_matches_scalar_version(self, target):
+        expected = [calculate_demographic_similarity(c, target) for c in CREATORS]
+        assert _batch(target).tolist() == pytest.approx(expected)
+
+    def test_empty_input(self):
+        assert len(calculate_demographic_similarities([], [], [], [], {'target_location': 'US'})) == 0
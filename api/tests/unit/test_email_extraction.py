@@ -112,3 +112,27 @@ class TestExtractEmailFromCreator:
         creator_field = "Creator (user.name+tag@example.com)"
         result = extract_email_from_creator(creator_field)
         assert result == "user.name+tag@example.com"
+
+    def test_pipe_not_accepted_in_tld(self):
+        """Test: A pipe character is not treated as part of the top-level domain"""
+        creator_field = "Creator (user@example.c|om)"
+        result = extract_email_from_creator(creator_field)
+        assert result is None
+
+    def test_plain_email_is_lowercased(self):
+        """Test: A bare email address is returned lowercased"""
+        creator_field = "  Owner.Name+Tag@Example.COM "
+        result = extract_email_from_creator(creator_field)
+        assert result == "owner.name+tag@example.com"
+
+    def test_plain_email_with_trailing_dot(self):
+        """Test: Trailing punctuation on a bare email is not part of the address"""
+        creator_field = "owner@example.com."
+        result = extract_email_from_creator(creator_field)
+        assert result == "owner@example.com"
+
+    def test_bare_email_without_tld(self):
+        """Test: A bare address without a top-level domain is not an email"""
+        creator_field = "owner@localhost"
+        result = extract_email_from_creator(creator_field)
+        assert result is None
@@ -0,0 +1,45 @@
+import pytest
+from datetime import date
+from app.routers.uploads import normalize_execution_date
+
+
+class TestNormalizeExecutionDate:
+    """Test cases for normalize_execution_date function."""
+
+    def test_iso_format(self):
+        """Test: YYYY-MM-DD"""
+        assert normalize_execution_date("2025-09-15") == date(2025, 9, 15)
+
+    def test_us_slash_format(self):
+        """Test: MM/DD/YYYY"""
+        assert normalize_execution_date("09/15/2025") == date(2025, 9, 15)
+
+    def test_day_first_fallback(self):
+        """Test: DD/MM/YYYY is used when the month-first parse is invalid"""
+        assert normalize_execution_date("25/09/2025") == date(2025, 9, 25)
+
+    def test_ambiguous_date_is_month_first(self):
+        """Test: Ambiguous dates stay month-first regardless of earlier inputs"""
+        normalize_execution_date("25/09/2025")
+        assert normalize_execution_date("03/04/2025") == date(2025, 3, 4)
+
+    def test_whitespace_is_trimmed(self):
+        """Test: Surrounding whitespace is ignored"""
+        assert normalize_execution_date("  2025-09-15 ") == date(2025, 9, 15)
+
+    def test_invalid_date(self):
+        """Test: Unparseable input returns None"""
+        assert normalize_execution_date("not a date") is None
+
+    def test_empty_string(self):
+        """Test: Empty string"""
+        assert normalize_execution_date("") is None
+
+    def test_dash_formats(self):
+        """Test: MM-DD-YYYY and DD-MM-YYYY"""
+        assert normalize_execution_date("09-15-2025") == date(2025, 9, 15)
+        assert normalize_execution_date("25-09-2025") == date(2025, 9, 25)
+
+    def test_year_first_slash_format(self):
+        """Test: YYYY/MM/DD"""
+        assert normalize_execution_date("2025/09/15") == date(2025, 9, 15)
@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.smart_matching import SmartMatchingService
+
+
+class FakeSession:
+    """Records executed statements and returns canned creator_adv_perf_mv aggregates."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+def _row(creator_id, same_clicks, same_conversions, cross_clicks, cross_conversions):
+    return SimpleNamespace(
+        creator_id=creator_id,
+        same_clicks=same_clicks,
+        same_conversions=same_conversions,
+        cross_clicks=cross_clicks,
+        cross_conversions=cross_conversions
+    )
+
+
+def _compiled_sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestBatchPerformanceData:
+    """_get_batch_performance_data reads the creator_adv_perf_mv rollup and splits creators into phases."""
+
+    def test_sums_are_cast_back_to_bigint(self):
+        db = FakeSession([])
+        SmartMatchingService(db)._get_batch_performance_data([1, 2], advertiser_id=None, category='Finance')
+
+        sql = _compiled_sql(db.statements[0])
+        assert 'FROM creator_adv_perf_mv' in sql
+        # SUM(bigint) is numeric in Postgres; Decimal sums broke float CPC arithmetic
+        assert sql.count('AS BIGINT)') == 4
+        assert 'FILTER (WHERE creator_adv_perf_mv.category = ' in sql
+        assert 'FILTER (WHERE creator_adv_perf_mv.category != ' in sql
+
+    def test_advertiser_split_when_no_category(self):
+        db = FakeSession([])
+        SmartMatchingService(db)._get_batch_performance_data([1], advertiser_id=7, category=None)
+
+        sql = _compiled_sql(db.statements[0])
+        assert 'FILTER (WHERE creator_adv_perf_mv.advertiser_id = ' in sql
+        assert 'FILTER (WHERE creator_adv_perf_mv.advertiser_id != ' in sql
+
+    def test_phases(self):
+        db = FakeSession([
+            _row(1, 200, 10, 50, 1),
+            _row(2, None, None, 400, 8),
+        ])
+        data = SmartMatchingService(db)._get_batch_performance_data([1, 2, 3], advertiser_id=7, category=None)
+
+        assert data[1]['phase'] == 1
+        assert data[1]['historical_cvr'] == pytest.approx(0.05)
+        assert data[1]['cross_cvr'] == pytest.approx(0.02)
+        assert data[2]['phase'] == 2
+        assert data[2]['total_clicks'] == 0
+        assert data[2]['cross_cvr'] == pytest.approx(0.02)
+        assert data[3]['phase'] == 3
+
+
+class TestCreatePerformanceDataBatch:
+    """Rollup rows flow through the vectorized builder with a float CPC."""
+
+    def test_expected_metrics_from_rollup(self):
+        db = FakeSession([
+            _row(1, 200, 10, 50, 1),
+            _row(2, None, None, 400, 8),
+        ])
+        service = SmartMatchingService(db)
+        creators = [
+            SimpleNamespace(creator_id=1, conservative_click_estimate=None),
+            SimpleNamespace(creator_id=2, conservative_click_estimate=None),
+            SimpleNamespace(creator_id=3, conservative_click_estimate=0),
+            SimpleNamespace(creator_id=4, conservative_click_estimate=80),
+        ]
+        perf = service._get_batch_performance_data([c.creator_id for c in creators], advertiser_id=7, category=None)
+
+        results = service._create_performance_data_batch(
+            creators, [perf[c.creator_id] for c in creators], cpc=1.25, advertiser_avg_cvr=0.01
+        )
+
+        phase1, phase2, phase3_default, phase3_estimate = results
+        # Phase 1: same-advertiser history, 200 clicks scaled to one placement
+        assert phase1['phase'] == 1
+        assert phase1['has_performance'] is True
+        assert phase1['expected_cvr'] == pytest.approx(0.05)
+        assert phase1['expected_clicks'] == pytest.approx(100.0)
+        assert phase1['expected_spend'] == pytest.approx(125.0)
+        assert phase1['expected_conversions'] == pytest.approx(5.0)
+        assert phase1['expected_cpa'] == pytest.approx(25.0)
+        assert phase1['historical_clicks'] == 200
+        # Phase 2: cross-performance only
+        assert phase2['phase'] == 2
+        assert phase2['expected_cvr'] == pytest.approx(0.02)
+        assert phase2['expected_clicks'] == pytest.approx(100.0)
+        assert phase2['historical_clicks'] == 400
+        # Phase 3: advertiser average CVR and conservative estimate, defaulting to 100
+        assert phase3_default['phase'] == 3
+        assert phase3_default['has_performance'] is False
+        assert phase3_default['expected_cvr'] == pytest.approx(0.01)
+        assert phase3_default['expected_clicks'] == pytest.approx(100.0)
+        assert phase3_estimate['expected_clicks'] == pytest.approx(80.0)
+        assert phase3_estimate['expected_spend'] == pytest.approx(100.0)
+        for result in results:
+            assert isinstance(result['expected_spend'], float)